@@ -3,32 +3,63 @@ Complete production FastAPI main application (with Render environment debug).
 """
 
 import os
+import time
+import asyncio
+import shutil
+import tempfile
 import logging
 import logging.config
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from fastapi import APIRouter
 
 from app.routers import analyze
+from app.services.nlp_analyzer import get_analyzer
 from app.utils.file_handler import cleanup_temp_files
+from app.utils.body_limit import MaxBodySizeMiddleware
 from app.utils.config import get_settings
-
-# ✅ DEBUG: Print environment check for Render startup logs
-print("🧠 DEBUG → OPENAI_API_KEY (first 8 chars):", 
-      os.getenv("OPENAI_API_KEY")[:8] + "..." if os.getenv("OPENAI_API_KEY") else "❌ NOT FOUND")
+from app.utils.cache import TTLCache
 
 # Get settings
 settings = get_settings()
 
+# ✅ DEBUG: Print environment check for Render startup logs
+if settings.DEBUG:
+    print("🧠 DEBUG → OPENAI_API_KEY (first 8 chars):", 
+          os.getenv("OPENAI_API_KEY")[:8] + "..." if os.getenv("OPENAI_API_KEY") else "❌ NOT FOUND")
+
 # Configure logging
 logging.config.dictConfig(settings.get_log_config())
 logger = logging.getLogger(__name__)
 
+# Temp directory availability, refreshed at most once per interval
+TEMP_DIR_CHECK_INTERVAL = 60
+_temp_dir_status = {"available": False, "checked_at": None}
+
+
+# Liveness is a constant; readiness results are reused for a few seconds
+HEALTH_OK = {"status": "ok"}
+READINESS_CACHE_TTL = 5
+readiness_cache = TTLCache(maxsize=1, ttl=READINESS_CACHE_TTL)
+
+
+def temp_dir_available() -> bool:
+    """Return whether the temp directory is usable, re-checking at most once a minute."""
+    now = time.monotonic()
+    checked_at = _temp_dir_status["checked_at"]
+    if checked_at is None or now - checked_at > TEMP_DIR_CHECK_INTERVAL:
+        try:
+            _temp_dir_status["available"] = os.path.exists(settings.get_temp_dir())
+        except OSError:
+            _temp_dir_status["available"] = False
+        _temp_dir_status["checked_at"] = now
+    return _temp_dir_status["available"]
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager for startup and shutdown."""
@@ -56,10 +87,24 @@ async def lifespan(app: FastAPI):
 
         # Temp directory setup
         temp_dir = settings.get_temp_dir()
+        temp_dir_available()
         logger.info(f"📁 Temp directory: {temp_dir}")
 
-        import shutil
-        disk_usage = shutil.disk_usage(temp_dir)
+        # Session directories come from tempfile.mkdtemp, so pointing
+        # tempfile.tempdir at tmpfs moves uploads off the container disk
+        if settings.USE_TMPFS:
+            if os.path.ismount("/dev/shm"):
+                tmpfs_free_mb = shutil.disk_usage("/dev/shm").free / (1024**2)
+                if tmpfs_free_mb >= settings.TMPFS_MIN_FREE_MB:
+                    os.makedirs(settings.TMPFS_DIR, exist_ok=True)
+                    tempfile.tempdir = settings.TMPFS_DIR
+                    logger.info(f"⚡ Upload temp files on tmpfs: {settings.TMPFS_DIR}")
+                else:
+                    logger.warning(f"⚠️ Only {tmpfs_free_mb:.0f} MB free on /dev/shm, keeping disk temp dir")
+            else:
+                logger.warning("⚠️ USE_TMPFS set but /dev/shm is not mounted")
+
+        disk_usage = shutil.disk_usage(tempfile.gettempdir())
         available_gb = disk_usage.free / (1024**3)
         logger.info(f"💾 Available disk space: {available_gb:.1f} GB")
 
@@ -67,16 +112,35 @@ async def lifespan(app: FastAPI):
             logger.warning("⚠️ Low disk space available!")
         
         logger.info("✅ API started successfully")
+        logger.info("🎯 Meeting Analysis API is ready to process files!")
+        if settings.DEBUG:
+            logger.info("📚 API docs at /docs")
+            logger.info("🔍 Debug endpoints available at /debug/*")
         
     except Exception as e:
         logger.error(f"❌ Startup failed: {e}")
         if not settings.DEBUG:
             raise
     
+    # Shared analyzer (and its pooled OpenAI HTTP client) for this worker
+    app.state.analyzer = get_analyzer()
+    
+    # Load ffmpeg and open the API connection now rather than on the first
+    # upload; the server only starts accepting requests once this returns
+    ffmpeg_warm, openai_warm = await asyncio.gather(
+        analyze.audio_processor.warm_up(),
+        app.state.analyzer.warm_up()
+    )
+    app.state.warmup = {"ffmpeg": ffmpeg_warm, "openai_api": openai_warm}
+    logger.info(f"🔥 Warm-up: ffmpeg={ffmpeg_warm}, openai_api={openai_warm}")
+    
     yield
     
     # Shutdown
     logger.info("🛑 Shutting down Meeting Analysis API...")
+    await app.state.analyzer.http_client.aclose()
+    get_analyzer.cache_clear()
+    analyze.audio_processor.close()
     try:
         cleanup_temp_files()
         logger.info("✅ Cleanup completed")
@@ -91,13 +155,20 @@ app = FastAPI(
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     contact={"name": "Meeting Analysis API", "url": "https://github.com/YashPansare31/Manthan-AI"},
     license_info={"name": "MIT", "url": "https://opensource.org/licenses/MIT"},
 )
 
-# Security middleware
-if settings.is_production():
-    app.add_middleware(TrustedHostMiddleware, allowed_hosts=["*"])
+# Security middleware; a "*" host list would accept everything, so only
+# register it when ALLOWED_HOSTS is an actual allow-list
+allowed_hosts = settings.allowed_hosts_list
+if settings.is_production() and allowed_hosts and "*" not in allowed_hosts:
+    app.add_middleware(TrustedHostMiddleware, allowed_hosts=allowed_hosts)
+
+# Reject oversized uploads from Content-Length (or while streaming)
+# before FastAPI parses and spools the multipart body
+app.add_middleware(MaxBodySizeMiddleware, max_body_size=settings.MAX_REQUEST_SIZE)
 
 # CORS middleware
 app.add_middleware(
@@ -115,7 +186,8 @@ app.add_middleware(
 async def http_exception_handler(request, exc):
     return JSONResponse(
         status_code=exc.status_code,
-        content={"error": "HTTP Error", "message": exc.detail, "status_code": exc.status_code}
+        content={"error": "HTTP Error", "message": exc.detail, "status_code": exc.status_code},
+        headers=getattr(exc, "headers", None)
     )
 
 @app.exception_handler(RequestValidationError)
@@ -144,12 +216,20 @@ async def root():
         "version": settings.APP_VERSION,
         "status": "operational",
         "docs": "/docs" if settings.DEBUG else "disabled",
-        "endpoints": {"analyze": "/api/analyze", "health": "/health", "status": "/api/status"}
+        "endpoints": {"analyze": "/api/analyze", "health": "/health", "ready": "/health/ready", "status": "/api/status"}
     }
 
 @app.get("/health")
 async def health_check():
-    import time
+    """Liveness probe: constant response, no syscalls or dependency checks."""
+    return HEALTH_OK
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness probe with dependency checks, recomputed at most every few seconds."""
+    cached = readiness_cache.get("ready")
+    if cached is not None:
+        return cached
     try:
         health_status = {
             "status": "healthy",
@@ -157,9 +237,10 @@ async def health_check():
             "version": settings.APP_VERSION,
             "services": {
                 "openai_api": settings.validate_api_keys(),
-                "temp_directory": os.path.exists(settings.get_temp_dir()),
+                "temp_directory": temp_dir_available(),
                 "disk_space_available": True
             },
+            "warmup": getattr(app.state, "warmup", None),
             "configuration": {
                 "debug_mode": settings.DEBUG,
                 "max_file_size_mb": settings.MAX_FILE_SIZE / 1024 / 1024,
@@ -169,6 +250,7 @@ async def health_check():
         }
         if not all(health_status["services"][s] for s in ["openai_api", "temp_directory"]):
             health_status["status"] = "degraded"
+        readiness_cache.set("ready", health_status)
         return health_status
     except Exception as e:
         logger.error(f"Health check failed: {e}")
@@ -194,7 +276,7 @@ async def api_info():
         }
     }
 
-# ✅ Added safe environment debug endpoint
+# ✅ Added safe environment debug endpoint (debug mode only)
 router = APIRouter()
 
 @router.get("/debug/env")
@@ -206,12 +288,5 @@ async def check_env():
         "api_key_preview": api_key[:8] + "..." if api_key else "NONE"
     }
 
-app.include_router(router)
-
-# Startup log
-@app.on_event("startup")
-async def startup_event():
-    logger.info("🎯 Meeting Analysis API is ready to process files!")
-    if settings.DEBUG:
-        logger.info(f"📚 API docs at /docs")
-        logger.info(f"🔍 Debug endpoints available at /debug/*")
+if settings.DEBUG:
+    app.include_router(router)
@@ -3,9 +3,14 @@ Complete Pydantic models for meeting analysis data structures.
 """
 
 from typing import List, Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationInfo, field_validator
+
+
+def utc_now() -> datetime:
+    """Current time as a timezone-aware UTC datetime (serialized with its offset)."""
+    return datetime.now(timezone.utc)
 
 
 class Priority(str, Enum):
@@ -42,13 +47,19 @@ class TranscriptSegment(BaseModel):
     end_time: float = Field(..., description="Segment end time in seconds")
     confidence: float = Field(..., ge=0.0, le=1.0, description="Transcription confidence score")
     
-    @validator('end_time')
-    def end_time_must_be_after_start_time(cls, v, values):
-        if 'start_time' in values and v <= values['start_time']:
+    @field_validator('end_time')
+    @classmethod
+    def end_time_must_be_after_start_time(cls, v: float, info: ValidationInfo) -> float:
+        if 'start_time' in info.data and v <= info.data['start_time']:
             raise ValueError('end_time must be greater than start_time')
         return v
 
 
+# Validates/serializes whole transcripts in one pydantic-core call, straight
+# from and to JSON bytes without an intermediate list of dicts
+TranscriptAdapter = TypeAdapter(List[TranscriptSegment])
+
+
 class ActionItem(BaseModel):
     """Extracted action item from meeting."""
     
@@ -91,9 +102,11 @@ class MeetingInsights(BaseModel):
 class AnalysisResponse(BaseModel):
     """Complete meeting analysis response."""
     
+    model_config = ConfigDict(use_enum_values=True, extra="ignore")
+    
     session_id: str = Field(..., description="Unique session identifier")
     filename: str = Field(..., description="Original filename")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Analysis timestamp")
+    timestamp: datetime = Field(default_factory=utc_now, description="Analysis timestamp")
     
     # Core analysis results
     transcript: List[TranscriptSegment] = Field(default_factory=list, description="Full meeting transcript")
@@ -109,13 +122,6 @@ class AnalysisResponse(BaseModel):
     duration: float = Field(..., ge=0.0, description="Total meeting duration in seconds")
     word_count: int = Field(..., ge=0, description="Total word count")
     processing_time: float = Field(..., ge=0.0, description="Total processing time in seconds")
-    
-    class Config:
-        """Pydantic model configuration."""
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class ErrorResponse(BaseModel):
@@ -157,6 +163,7 @@ __all__ = [
     "SentimentLabel", 
     "ProcessingStatus",
     "TranscriptSegment",
+    "TranscriptAdapter",
     "ActionItem",
     "KeyDecision",
     "SpeakerStats",
@@ -3,36 +3,462 @@ Complete production analysis endpoint router using API services.
 """
 
 import os
+import asyncio
 import tempfile
 import traceback
 import uuid
 import time
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple, Union
 
-from fastapi import APIRouter, File, UploadFile, HTTPException, BackgroundTasks, Depends
-from fastapi.responses import JSONResponse
+import orjson
+import aiofiles
+from fastapi import APIRouter, File, Form, Request, UploadFile, HTTPException, BackgroundTasks, Depends
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from app.models.schemas import AnalysisResponse, ErrorResponse
+from app.models.schemas import (
+    AnalysisResponse, ErrorResponse, SessionStatusResponse, TranscriptAdapter, TranscriptSegment
+)
 from app.services.audio_processor import ProductionAudioProcessor
-from app.services.nlp_analyzer import ProductionNLPAnalyzer
-from app.utils.file_handler import validate_audio_file, cleanup_temp_files
+from app.services.nlp_analyzer import ProductionNLPAnalyzer, get_analyzer
+from app.services.batch_jobs import batch_job_manager
+from app.utils.file_handler import validate_audio_file, cleanup_temp_files, get_safe_filename
 from app.utils.config import get_settings, Settings
+from app.utils.cache import DiskCache, TTLCache, content_hasher
 
 router = APIRouter()
 
+_settings = get_settings()
+
+# Processed audio and transcripts keyed by a hash of the uploaded audio
+# bytes; on disk, so they survive restarts and are shared between workers
+audio_cache = (
+    DiskCache(_settings.AUDIO_CACHE_DIR, _settings.AUDIO_CACHE_MAX_MB * 1024 * 1024)
+    if _settings.AUDIO_CACHE_MAX_MB > 0 else None
+)
+
 # Initialize services
-audio_processor = ProductionAudioProcessor()
+audio_processor = ProductionAudioProcessor(cache=audio_cache)
+
+# Analysis results keyed by a hash of the uploaded audio bytes
+analysis_cache = TTLCache(
+    maxsize=_settings.ANALYSIS_CACHE_MAX_ENTRIES,
+    ttl=_settings.ANALYSIS_CACHE_TTL
+)
+
+# Bounds simultaneous audio decoding/processing in this worker; requests
+# beyond ANALYZE_QUEUE_LIMIT waiters are turned away with a 503
+_analyze_semaphore = asyncio.Semaphore(_settings.ANALYZE_CONCURRENCY)
+_analyze_queue = {"waiting": 0}
+
+# Built once rather than on every rejected upload
+_INVALID_FORMAT_MESSAGE = (
+    f"Invalid file format. Supported: {', '.join(_settings.supported_formats_list).upper()} "
+    f"(max {_settings.MAX_FILE_SIZE / 1024 / 1024:.1f}MB)"
+)
+
+# Upload is streamed to disk in chunks of this size instead of being read whole
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
 
 def get_settings_dependency() -> Settings:
     """Dependency to get settings."""
     return get_settings()
 
-@router.post("/analyze", response_model=AnalysisResponse)
+
+def get_nlp_analyzer() -> ProductionNLPAnalyzer:
+    """Dependency to get the worker's shared NLP analyzer."""
+    return get_analyzer()
+
+
+def _file_too_large(max_size: int) -> HTTPException:
+    """Build the error raised when an upload exceeds the size limit."""
+    return HTTPException(
+        status_code=413,
+        detail=f"File too large. Maximum size: {max_size / 1024 / 1024:.1f}MB"
+    )
+
+
+def _sendfile_copy(src_fd: int, dst_path: str, size: int, hasher=None) -> None:
+    """Copy ``size`` bytes from ``src_fd`` into ``dst_path`` inside the kernel."""
+    with open(dst_path, "wb") as dst:
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(dst.fileno(), src_fd, offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    
+    if hasher is not None:
+        offset = 0
+        while offset < size:
+            chunk = os.pread(src_fd, UPLOAD_CHUNK_SIZE, offset)
+            if not chunk:
+                break
+            hasher.update(chunk)
+            offset += len(chunk)
+
+
+async def _persist_upload(upload: UploadFile, dst_path: str, max_size: int, hasher=None) -> int:
+    """
+    Write an uploaded file to disk, enforcing the size limit.
+    
+    Uploads that have already spilled to a real file are copied with
+    ``os.sendfile`` so the bytes never pass through Python; in-memory
+    uploads are streamed in chunks.
+    
+    Args:
+        upload: Uploaded file object from FastAPI
+        dst_path: Destination file path
+        max_size: Maximum allowed size in bytes
+        hasher: Optional hashlib-style object fed with the uploaded bytes
+        
+    Returns:
+        Number of bytes written
+    """
+    spooled = upload.file
+    if hasattr(os, "sendfile") and getattr(spooled, "_rolled", False):
+        src_fd = spooled.fileno()
+        size = os.fstat(src_fd).st_size
+        if size > max_size:
+            raise _file_too_large(max_size)
+        try:
+            await asyncio.to_thread(_sendfile_copy, src_fd, dst_path, size, hasher)
+            return size
+        except OSError:
+            # sendfile unsupported for this fd pair, fall back to streaming
+            await upload.seek(0)
+    
+    file_size = 0
+    async with aiofiles.open(dst_path, "wb") as dst:
+        while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+            file_size += len(chunk)
+            if file_size > max_size:
+                raise _file_too_large(max_size)
+            if hasher is not None:
+                hasher.update(chunk)
+            await dst.write(chunk)
+    return file_size
+
+
+def _validate_upload(file: UploadFile, settings: Settings) -> None:
+    """
+    Reject uploads that cannot be analyzed before anything is written to disk.
+    
+    Args:
+        file: Uploaded file object from FastAPI
+        settings: Application settings
+    """
+    # Validate API key first
+    if not settings.validate_api_keys():
+        raise HTTPException(
+            status_code=500, 
+            detail="OpenAI API key not configured or invalid"
+        )
+    
+    # Validate file presence
+    if not file.filename:
+        raise HTTPException(
+            status_code=400, 
+            detail="No file provided"
+        )
+        
+    # Validate file format and size
+    if not validate_audio_file(file):
+        raise HTTPException(
+            status_code=400, 
+            detail=_INVALID_FORMAT_MESSAGE
+        )
+    
+    # Check file size if available
+    if hasattr(file, 'size') and file.size:
+        if file.size > settings.MAX_FILE_SIZE:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large ({file.size / 1024 / 1024:.1f}MB). Maximum size: {settings.MAX_FILE_SIZE / 1024 / 1024:.1f}MB"
+            )
+
+
+def _make_session_dir(session_id: str, upload_size: Optional[int], settings: Settings) -> str:
+    """
+    Create the temp directory holding a session's upload and processed audio.
+    
+    Small uploads (voice memos) go to RAM-backed /dev/shm when it is mounted,
+    so saving, ffmpeg and Whisper reads never touch the disk; larger ones use
+    the regular temp dir. Either way the directory is removed with
+    cleanup_temp_files.
+    
+    Args:
+        session_id: Session identifier
+        upload_size: Upload size in bytes, if the client sent it
+        settings: Application settings
+    
+    Returns:
+        Path to the new directory
+    """
+    prefix = f"session_{session_id}_"
+    if upload_size and upload_size <= settings.SMALL_UPLOAD_MAX_BYTES and os.path.isdir("/dev/shm"):
+        try:
+            os.makedirs(settings.TMPFS_DIR, exist_ok=True)
+            return tempfile.mkdtemp(prefix=prefix, dir=settings.TMPFS_DIR)
+        except OSError:
+            pass
+    return tempfile.mkdtemp(prefix=prefix)
+
+
+async def _save_upload(
+    file: UploadFile,
+    temp_dir: str,
+    session_id: str,
+    settings: Settings
+) -> Tuple[str, str]:
+    """
+    Save an upload into the session's temp directory.
+    
+    Args:
+        file: Uploaded file object from FastAPI
+        temp_dir: Session temp directory
+        session_id: Session identifier
+        settings: Application settings
+    
+    Returns:
+        Tuple of (saved file path, content hash of the upload)
+    """
+    safe_filename = f"{session_id}_{get_safe_filename(file.filename)}"
+    temp_filepath = os.path.join(temp_dir, safe_filename)
+    
+    # Save uploaded file
+    print(f"📁 Saving uploaded file: {file.filename} ({file.size if hasattr(file, 'size') else 'unknown size'} bytes)")
+    
+    upload_hash = content_hasher()
+    try:
+        await _persist_upload(file, temp_filepath, settings.MAX_FILE_SIZE, upload_hash)
+    finally:
+        # Release the spooled copy now rather than when the request ends;
+        # for streamed responses that is only after analysis completes
+        await file.close()
+    
+    return temp_filepath, upload_hash.hexdigest()
+
+
+async def _load_transcript(content_hash: str) -> Optional[List[TranscriptSegment]]:
+    """Return the cached transcript of identical audio, if any."""
+    if audio_cache is None:
+        return None
+    cached = await asyncio.to_thread(audio_cache.get_bytes, f"{content_hash}_transcript.json")
+    if cached is None:
+        return None
+    try:
+        return TranscriptAdapter.validate_json(cached)
+    except ValueError:
+        return None
+
+
+async def _store_transcript(content_hash: str, segments: List[TranscriptSegment]) -> None:
+    """Cache a transcript for later uploads of identical audio."""
+    if audio_cache is None or not segments:
+        return
+    await asyncio.to_thread(
+        audio_cache.set_bytes,
+        f"{content_hash}_transcript.json",
+        TranscriptAdapter.dump_json(segments)
+    )
+
+
+async def _prepare_audio(
+    file_path: str,
+    session_id: str,
+    filename: str,
+    content_hash: str,
+    settings: Settings
+) -> List[Tuple[str, float]]:
+    """
+    Validate a saved upload and process it for transcription.
+    
+    At most ANALYZE_CONCURRENCY uploads are processed at once per worker;
+    once ANALYZE_QUEUE_LIMIT more are waiting, new ones get a 503.
+    
+    Args:
+        file_path: Path to the saved upload
+        session_id: Session identifier for output naming
+        filename: Original filename, for logging
+        content_hash: Content hash of the upload, for the processed-audio cache
+        settings: Application settings
+    
+    Returns:
+        Processed audio as (path, start offset) chunks; long recordings are
+        split at pauses so the chunks can be transcribed in parallel
+    """
+    if _analyze_semaphore.locked() and _analyze_queue["waiting"] >= settings.ANALYZE_QUEUE_LIMIT:
+        print(f"🚦 Too many uploads queued, rejecting {filename}")
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy processing other files. Please try again shortly.",
+            headers={"Retry-After": str(settings.ANALYZE_RETRY_AFTER)}
+        )
+    
+    _analyze_queue["waiting"] += 1
+    try:
+        await _analyze_semaphore.acquire()
+    finally:
+        _analyze_queue["waiting"] -= 1
+    
+    try:
+        # One probe validates the file and supplies its metadata
+        print(f"🔧 Processing audio file: {filename}")
+        audio_info, processed_audio_path = await audio_processor.probe_and_process(
+            file_path,
+            session_id,
+            output_dir=os.path.dirname(file_path),
+            max_duration=settings.MAX_AUDIO_DURATION,
+            cache_key=content_hash
+        )
+        if processed_audio_path is not None:
+            audio_chunks = await audio_processor.split_on_silence(
+                processed_audio_path,
+                os.path.dirname(file_path),
+                settings.TRANSCRIPTION_CHUNK_SECONDS
+            )
+    finally:
+        _analyze_semaphore.release()
+    
+    if processed_audio_path is None:
+        if "error" in audio_info or audio_info["duration"] <= 0:
+            raise HTTPException(
+                status_code=400,
+                detail="Uploaded file appears to be corrupted or invalid"
+            )
+        raise HTTPException(
+            status_code=400,
+            detail=f"Audio too long ({audio_info['duration']:.1f}s). Maximum: {settings.MAX_AUDIO_DURATION}s"
+        )
+    
+    print(f"🎵 Audio info: {audio_info.get('duration', 0):.1f}s, {audio_info.get('sample_rate', 0)}Hz")
+    
+    return audio_chunks
+
+
+async def _run_analysis(
+    file_path: str,
+    session_id: str,
+    filename: str,
+    content_hash: str,
+    settings: Settings,
+    nlp_analyzer: ProductionNLPAnalyzer
+) -> Dict[str, Any]:
+    """
+    Validate, process and analyze a saved upload.
+    
+    A cached transcript of identical audio skips processing and Whisper.
+    
+    Args:
+        file_path: Path to the saved upload
+        session_id: Session identifier for output naming
+        filename: Original filename, for logging
+        content_hash: Content hash of the upload
+        settings: Application settings
+        nlp_analyzer: Shared NLP analyzer
+    
+    Returns:
+        Analysis results from the NLP analyzer
+    """
+    transcript_segments = await _load_transcript(content_hash)
+    if transcript_segments is not None:
+        print(f"♻️ Cached transcript for {filename}, skipping transcription")
+        return await nlp_analyzer.analyze_transcript(transcript_segments)
+    
+    audio_chunks = await _prepare_audio(file_path, session_id, filename, content_hash, settings)
+    
+    # Analyze using API services
+    print("🧠 Performing analysis with OpenAI API...")
+    analysis_result = await nlp_analyzer.analyze_meeting(audio_chunks)
+    
+    # The transcript is real even when some GPT tasks failed; only demo data is not
+    if not analysis_result.get("demo"):
+        await _store_transcript(content_hash, analysis_result["transcript"])
+    
+    return analysis_result
+
+
+async def _transcribe_upload(
+    nlp_analyzer: ProductionNLPAnalyzer,
+    file_path: str,
+    session_id: str,
+    filename: str,
+    content_hash: str,
+    settings: Settings
+) -> List[TranscriptSegment]:
+    """
+    Transcribe a saved upload, reusing the cached transcript of identical audio.
+    
+    Args:
+        nlp_analyzer: Analyzer used for the Whisper call
+        file_path: Path to the saved upload
+        session_id: Session identifier for output naming
+        filename: Original filename, for logging
+        content_hash: Content hash of the upload
+        settings: Application settings
+    
+    Returns:
+        Transcript segments
+    """
+    transcript_segments = await _load_transcript(content_hash)
+    if transcript_segments is not None:
+        print(f"♻️ Cached transcript for {filename}, skipping transcription")
+        return transcript_segments
+    
+    audio_chunks = await _prepare_audio(file_path, session_id, filename, content_hash, settings)
+    transcript_segments = await nlp_analyzer.transcribe(audio_chunks)
+    await _store_transcript(content_hash, transcript_segments)
+    return transcript_segments
+
+
+async def _submit_batch_analysis(
+    file_path: str,
+    session_id: str,
+    filename: str,
+    content_hash: str,
+    settings: Settings,
+    nlp_analyzer: ProductionNLPAnalyzer
+) -> SessionStatusResponse:
+    """
+    Transcribe a saved upload and queue its GPT analyses on the OpenAI Batch API.
+    
+    Args:
+        file_path: Path to the saved upload
+        session_id: Session identifier
+        filename: Original filename
+        content_hash: Content hash of the upload
+        settings: Application settings
+        nlp_analyzer: Shared NLP analyzer
+    
+    Returns:
+        Session status; poll /sessions/{session_id} for completion
+    """
+    print("🧠 Transcribing with OpenAI API, analysis queued for batch...")
+    transcript_segments = await _transcribe_upload(
+        nlp_analyzer, file_path, session_id, filename, content_hash, settings
+    )
+    full_text = " ".join(seg.text for seg in transcript_segments)
+    if not full_text.strip():
+        raise HTTPException(
+            status_code=400,
+            detail="No content could be transcribed from the audio file"
+        )
+    submission = await nlp_analyzer.submit_batch_analysis(full_text)
+    
+    return await batch_job_manager.submit(
+        session_id, filename, content_hash, submission, nlp_analyzer,
+        transcript_segments, analysis_cache
+    )
+
+
+@router.post("/analyze", response_model=Union[AnalysisResponse, SessionStatusResponse])
 async def analyze_meeting(
     background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
-    settings: Settings = Depends(get_settings_dependency)
-) -> AnalysisResponse:
+    priority: str = Form("interactive"),
+    settings: Settings = Depends(get_settings_dependency),
+    nlp_analyzer: ProductionNLPAnalyzer = Depends(get_nlp_analyzer)
+) -> Union[AnalysisResponse, SessionStatusResponse]:
     """
     Analyze uploaded meeting recording using OpenAI API services.
     
@@ -43,6 +469,10 @@ async def analyze_meeting(
     4. Analyzes content using GPT models
     5. Returns structured analysis results
     
+    With ``priority=batch`` the GPT analyses are queued on the OpenAI Batch API
+    (cheaper, up to 24h turnaround) and a session status is returned instead;
+    poll /sessions/{session_id} and fetch /sessions/{session_id}/result.
+    
     Supported formats: MP3, WAV, MP4, M4A, OGG, FLAC (max 25MB)
     """
     
@@ -52,80 +482,40 @@ async def analyze_meeting(
     start_time = time.time()
     
     try:
-        # Validate API key first
-        if not settings.validate_api_keys():
-            raise HTTPException(
-                status_code=500, 
-                detail="OpenAI API key not configured or invalid"
-            )
-        
-        # Validate file presence
-        if not file.filename:
-            raise HTTPException(
-                status_code=400, 
-                detail="No file provided"
-            )
-            
-        # Validate file format and size
-        if not validate_audio_file(file):
-            supported_formats = ", ".join(settings.supported_formats_list)
+        if priority not in ("interactive", "batch"):
             raise HTTPException(
-                status_code=400, 
-                detail=f"Invalid file format. Supported: {supported_formats.upper()} (max {settings.MAX_FILE_SIZE / 1024 / 1024:.1f}MB)"
+                status_code=400,
+                detail="Invalid priority. Supported: interactive, batch"
             )
         
-        # Check file size if available
-        if hasattr(file, 'size') and file.size:
-            if file.size > settings.MAX_FILE_SIZE:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"File too large ({file.size / 1024 / 1024:.1f}MB). Maximum size: {settings.MAX_FILE_SIZE / 1024 / 1024:.1f}MB"
-                )
+        _validate_upload(file, settings)
         
         # Create temporary directory for this session
-        temp_dir = tempfile.mkdtemp(prefix=f"session_{session_id}_")
-        safe_filename = f"{session_id}_{file.filename}"
-        temp_filepath = os.path.join(temp_dir, safe_filename)
-        
-        # Save uploaded file
-        print(f"📁 Saving uploaded file: {file.filename} ({file.size if hasattr(file, 'size') else 'unknown size'} bytes)")
+        temp_dir = await asyncio.to_thread(_make_session_dir, session_id, file.size, settings)
+        temp_filepath, content_hash = await _save_upload(file, temp_dir, session_id, settings)
         
-        with open(temp_filepath, "wb") as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-        
-        # Validate saved file
-        if not audio_processor.validate_audio_file(temp_filepath):
-            raise HTTPException(
-                status_code=400,
-                detail="Uploaded file appears to be corrupted or invalid"
+        # Reuse a previous analysis of identical audio
+        analysis_result = analysis_cache.get(content_hash)
+        if analysis_result is not None:
+            print(f"♻️ Cache hit for {file.filename}, skipping processing")
+        elif priority == "batch":
+            status = await _submit_batch_analysis(
+                temp_filepath, session_id, file.filename, content_hash, settings, nlp_analyzer
             )
-        
-        # Get audio info for logging
-        audio_info = audio_processor.get_audio_info(temp_filepath)
-        print(f"🎵 Audio info: {audio_info.get('duration', 0):.1f}s, {audio_info.get('sample_rate', 0)}Hz")
-        
-        # Check duration limits
-        if audio_info.get('duration', 0) > settings.MAX_AUDIO_DURATION:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Audio too long ({audio_info['duration']:.1f}s). Maximum: {settings.MAX_AUDIO_DURATION}s"
+            background_tasks.add_task(cleanup_temp_files, temp_dir)
+            print(f"📦 Batch analysis queued for session: {session_id}")
+            return status
+        else:
+            analysis_result = await _run_analysis(
+                temp_filepath, session_id, file.filename, content_hash, settings, nlp_analyzer
             )
-        
-        # Process audio file
-        print(f"🔧 Processing audio file: {file.filename}")
-        processed_audio_path = await audio_processor.process_audio(
-            temp_filepath, session_id
-        )
-        
-        # Analyze using API services
-        print("🧠 Performing analysis with OpenAI API...")
-        async with ProductionNLPAnalyzer() as nlp_analyzer:
-            analysis_result = await nlp_analyzer.analyze_meeting(processed_audio_path)
+            # Never cache partial results or the demo data returned when the API calls fail
+            if not analysis_result.pop("fallback", False):
+                analysis_cache.set(content_hash, analysis_result)
         
         # Calculate total processing time
         processing_time = time.time() - start_time
-        analysis_result["processing_time"] = round(processing_time, 2)
+        analysis_result = {**analysis_result, "processing_time": round(processing_time, 2)}
         
         # Build response
         response = AnalysisResponse(
@@ -160,19 +550,136 @@ async def analyze_meeting(
             detail="An error occurred while processing your file. Please try again or contact support if the problem persists."
         )
 
+def _ndjson(payload: Dict[str, Any]) -> bytes:
+    """Encode one NDJSON line."""
+    return orjson.dumps(payload) + b"\n"
+
+
+async def _stream_analysis(
+    session_id: str,
+    filename: str,
+    temp_dir: str,
+    temp_filepath: str,
+    content_hash: str,
+    settings: Settings,
+    nlp_analyzer: ProductionNLPAnalyzer,
+    start_time: float
+) -> AsyncIterator[bytes]:
+    """
+    Run the analysis pipeline, yielding NDJSON lines as results become available.
+    
+    Lines are ``session`` first, then one ``segment`` per transcript segment,
+    then a final ``analysis`` line with everything except the transcript, or
+    an ``error`` line if processing fails.
+    """
+    try:
+        yield _ndjson({"type": "session", "session_id": session_id, "filename": filename})
+        
+        analysis_result = analysis_cache.get(content_hash)
+        if analysis_result is not None:
+            print(f"♻️ Cache hit for {filename}, skipping processing")
+            for segment in analysis_result["transcript"]:
+                yield _ndjson({"type": "segment", **segment.model_dump(mode="json")})
+        else:
+            print("🧠 Performing analysis with OpenAI API...")
+            transcript_segments = await _transcribe_upload(
+                nlp_analyzer, temp_filepath, session_id, filename, content_hash, settings
+            )
+            for segment in transcript_segments:
+                yield _ndjson({"type": "segment", **segment.model_dump(mode="json")})
+            
+            analysis_result = await nlp_analyzer.analyze_transcript(transcript_segments)
+            # Never cache partial results or demo data
+            if not analysis_result.pop("fallback", False):
+                analysis_cache.set(content_hash, analysis_result)
+        
+        processing_time = time.time() - start_time
+        response = AnalysisResponse(
+            session_id=session_id,
+            filename=filename,
+            **{**analysis_result, "processing_time": round(processing_time, 2)}
+        )
+        yield _ndjson({"type": "analysis", **response.model_dump(mode="json", exclude={"transcript"})})
+        
+        print(f"✅ Streamed analysis completed for session: {session_id} in {processing_time:.2f}s")
+        
+    except HTTPException as e:
+        yield _ndjson({"type": "error", "message": e.detail, "status_code": e.status_code})
+        
+    except Exception as e:
+        print(f"❌ Error processing file: {str(e)}")
+        print(traceback.format_exc())
+        yield _ndjson({
+            "type": "error",
+            "message": "An error occurred while processing your file. Please try again or contact support if the problem persists.",
+            "status_code": 500
+        })
+        
+    finally:
+        await asyncio.to_thread(cleanup_temp_files, temp_dir)
+
+
+@router.post("/analyze/stream")
+async def analyze_meeting_stream(
+    file: UploadFile = File(...),
+    settings: Settings = Depends(get_settings_dependency),
+    nlp_analyzer: ProductionNLPAnalyzer = Depends(get_nlp_analyzer)
+) -> StreamingResponse:
+    """
+    Analyze an uploaded meeting recording, streaming results as NDJSON.
+    
+    The upload is validated and saved before the response starts; transcript
+    segments are then sent as soon as transcription finishes, without waiting
+    for the GPT analyses. See _stream_analysis for the line format.
+    """
+    session_id = str(uuid.uuid4())
+    start_time = time.time()
+    
+    _validate_upload(file, settings)
+    
+    temp_dir = await asyncio.to_thread(_make_session_dir, session_id, file.size, settings)
+    try:
+        temp_filepath, content_hash = await _save_upload(file, temp_dir, session_id, settings)
+    except Exception:
+        await asyncio.to_thread(cleanup_temp_files, temp_dir)
+        raise
+    
+    return StreamingResponse(
+        _stream_analysis(
+            session_id, file.filename, temp_dir, temp_filepath, content_hash,
+            settings, nlp_analyzer, start_time
+        ),
+        media_type="application/x-ndjson"
+    )
+
 @router.get("/sessions/{session_id}")
 async def get_session_status(session_id: str):
     """
-    Get status of a processing session.
+    Get status of a batch processing session.
     
-    Note: In this stateless implementation, all sessions are marked as completed.
-    In a production system with persistent storage, this would check actual status.
+    Batch jobs are shared by every worker, so any of them can answer.
+    Interactive sessions finish within their request and are not stored.
     """
-    return {
-        "session_id": session_id,
-        "status": "completed",
-        "message": "Session processing completed"
-    }
+    status = await batch_job_manager.get_status(session_id)
+    if status is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Unknown or expired session"
+        )
+    return status
+
+@router.get("/sessions/{session_id}/result", response_model=AnalysisResponse)
+async def get_session_result(session_id: str) -> AnalysisResponse:
+    """
+    Get the analysis of a completed batch session.
+    """
+    result = await batch_job_manager.get_result(session_id)
+    if result is None:
+        raise HTTPException(
+            status_code=404,
+            detail="No completed analysis for this session"
+        )
+    return result
 
 @router.delete("/sessions/{session_id}")
 async def delete_session(
@@ -195,17 +702,22 @@ async def delete_session(
     }
 
 @router.get("/status")
-async def service_status(settings: Settings = Depends(get_settings_dependency)):
+async def service_status(
+    request: Request,
+    settings: Settings = Depends(get_settings_dependency)
+):
     """
-    Get detailed service status.
+    Get detailed service status, including startup warm-up results.
     """
+    temp_directory = await asyncio.to_thread(os.path.isdir, settings.TEMP_DIR)
     return {
         "status": "operational",
         "services": {
             "audio_processor": audio_processor.is_ready(),
             "openai_api": settings.validate_api_keys(),
-            "temp_directory": os.path.exists(settings.get_temp_dir())
+            "temp_directory": temp_directory
         },
+        "warmup": getattr(request.app.state, "warmup", None),
         "limits": {
             "max_file_size_mb": settings.MAX_FILE_SIZE / 1024 / 1024,
             "max_duration_seconds": settings.MAX_AUDIO_DURATION,
@@ -4,8 +4,10 @@ Business logic services package for meeting analysis.
 
 from .audio_processor import ProductionAudioProcessor
 from .nlp_analyzer import ProductionNLPAnalyzer
+from .batcher import AsyncBatcher
 
 __all__ = [
     "ProductionAudioProcessor",
-    "ProductionNLPAnalyzer"
+    "ProductionNLPAnalyzer",
+    "AsyncBatcher"
 ]
\ No newline at end of file
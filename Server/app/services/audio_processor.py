@@ -1,43 +1,345 @@
 """
 Production audio processor - NO LIBROSA/SOUNDFILE dependencies.
-Uses only pydub for basic audio processing.
+Uses the ffmpeg binary when available, pydub otherwise.
 """
 
 import os
+import re
+import json
+import shutil
 import tempfile
 import asyncio
 import logging
-from typing import Optional
-
-from pydub import AudioSegment
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
+from app.utils.cache import DiskCache
 from app.utils.config import get_settings
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Trim silence at the start and end only (reversing to reach the tail);
+# interior pauses stay, so transcript timestamps are off by at most the
+# trimmed lead-in. Then loudness-normalize. Whisper is billed per second of audio.
+PREPROCESS_FILTER = (
+    "silenceremove=start_periods=1:start_threshold=-40dB,"
+    "areverse,"
+    "silenceremove=start_periods=1:start_threshold=-40dB,"
+    "areverse,"
+    "loudnorm=I=-16:TP=-1.5"
+)
+FFMPEG_TIMEOUT = 300  # seconds
+
+# Processed output encodings: file extension (Whisper detects the format
+# from it) and ffmpeg output options. 16kHz mono speech is ~32KB/s as WAV,
+# roughly half that as FLAC and ~3KB/s as 24kbps Opus.
+OUTPUT_FORMATS = {
+    "wav": ("wav", ["-f", "wav"]),
+    "flac": ("flac", ["-c:a", "flac", "-compression_level", "5", "-f", "flac"]),
+    "opus": ("ogg", ["-c:a", "libopus", "-b:a", "24k", "-application", "voip", "-f", "ogg"]),
+}
+FFPROBE_TIMEOUT = 30  # seconds
+
+# Pauses used as cut points when splitting long audio for parallel transcription
+SILENCE_DETECT_FILTER = "silencedetect=noise=-30dB:d=0.5"
+_SILENCE_RE = re.compile(r"silence_(start|end): (-?[\d.]+)")
+
+# Input that is already 16kHz mono PCM skips re-encoding only if its levels
+# are close to what loudnorm would produce: mean volume (dBFS) in this range
+# and peaks below clipping. Leading/trailing silence is then left in place.
+READY_MEAN_VOLUME_RANGE = (-30.0, -12.0)
+READY_MAX_VOLUME = -0.5
+_VOLUME_RE = re.compile(r"(mean|max)_volume: (-?[\d.]+) dB")
+
+
+async def _run_ffmpeg(command: List[str]) -> Tuple[int, bytes]:
+    """
+    Run an ffmpeg command without blocking the event loop.
+    
+    Args:
+        command: Full command line, binary first
+        
+    Returns:
+        Tuple of (return code, stderr output)
+        
+    Raises:
+        OSError: If the process cannot be started
+        asyncio.TimeoutError: If it runs longer than FFMPEG_TIMEOUT (it is killed)
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *command,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        _, stderr = await asyncio.wait_for(proc.communicate(), timeout=FFMPEG_TIMEOUT)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, stderr
+
+
+def _choose_cut_points(duration: float, silences: List[float], chunk_seconds: float) -> List[float]:
+    """
+    Pick split points roughly every ``chunk_seconds``, preferring pauses.
+    
+    Args:
+        duration: Audio duration in seconds
+        silences: Midpoints of detected pauses, ascending
+        chunk_seconds: Target chunk length
+        
+    Returns:
+        Ascending cut times; chunks are [0, c1), [c1, c2), ..., [cN, duration)
+    """
+    cuts = []
+    start = 0.0
+    while duration - start > chunk_seconds * 1.5:
+        target = start + chunk_seconds
+        window = [t for t in silences if start + chunk_seconds / 2 <= t <= start + chunk_seconds * 1.5]
+        cut = min(window, key=lambda t: abs(t - target)) if window else target
+        cuts.append(cut)
+        start = cut
+    return cuts
+
+
+def _link_or_copy(cached_path: str, output_path: str) -> str:
+    """
+    Hard-link a file into the session directory, copying it across filesystems.
+    
+    Session directories may be on tmpfs while the cache is on disk, and a
+    cache file used in place could be evicted by another request's trim().
+    """
+    try:
+        os.link(cached_path, output_path)
+    except OSError:
+        shutil.copyfile(cached_path, output_path)
+    return output_path
+
+
+def _process_with_pydub(
+    file_path: str,
+    output_path: str,
+    target_sample_rate: int,
+    max_duration: float
+) -> str:
+    """
+    Synchronous pydub fallback used when ffmpeg is unavailable.
+    
+    Module-level so it can run in a process pool.
+    """
+    # pydub is only needed without ffmpeg, so it is imported on first use
+    # rather than in every worker at startup
+    from pydub import AudioSegment
+    
+    try:
+        logger.debug("Processing with pydub")
+        
+        # Load audio with pydub, decoding no more than max_duration so
+        # every later pass works on the truncated audio only
+        audio = AudioSegment.from_file(file_path, duration=max_duration)
+        
+        # Validate audio data
+        if len(audio) == 0:
+            raise ValueError("Empty audio data")
+        
+        # Convert to mono before resampling so the resampler sees half the data
+        if audio.channels > 1:
+            audio = audio.set_channels(1)
+        
+        # Set sample rate to 16kHz (optimal for Whisper)
+        audio = audio.set_frame_rate(target_sample_rate)
+        
+        # Normalize volume
+        audio = audio.normalize()
+        
+        # Export as WAV for consistent format
+        audio.export(output_path, format="wav")
+        
+        # Verify output file was created
+        if not os.path.exists(output_path):
+            raise RuntimeError("Failed to create output file")
+        
+        logger.debug(f"Pydub processing successful: {output_path}")
+        return output_path
+        
+    except Exception as e:
+        logger.error(f"Audio processing failed: {e}")
+        # If processing fails, return original file
+        return file_path
+
+
+# Leading bytes of the containers we accept
+_AUDIO_MAGIC = (
+    (b"ID3", "mp3"),
+    (b"OggS", "ogg"),
+    (b"fLaC", "flac"),
+    (b"\x1a\x45\xdf\xa3", "webm"),
+)
+
+
+def _sniff_audio_format(header: bytes) -> Optional[str]:
+    """
+    Identify a supported audio container from its first bytes.
+    
+    Args:
+        header: At least the first 12 bytes of the file
+        
+    Returns:
+        Format name, or None if the signature is not recognized
+    """
+    for magic, fmt in _AUDIO_MAGIC:
+        if header.startswith(magic):
+            return fmt
+    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+        return "wav"
+    if header[4:8] == b"ftyp":
+        return "mp4"
+    # MPEG audio frame sync (MP3 without an ID3 tag)
+    if header[0] == 0xFF and header[1] & 0xE0 == 0xE0:
+        return "mp3"
+    return None
+
+
+@lru_cache(maxsize=256)
+def _probe_audio(ffprobe_path: str, file_path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Read duration and stream parameters from container metadata with ffprobe.
+    
+    Cached per (path, mtime, size), so probing the same upload again (e.g.
+    before and after validation) costs nothing while a rewritten file is
+    re-probed. Callers must not mutate the returned dict.
+    
+    Args:
+        ffprobe_path: Path to the ffprobe binary
+        file_path: Path to audio file
+        mtime_ns: File modification time, part of the cache key
+        size: File size in bytes, part of the cache key
+        
+    Returns:
+        Dictionary with audio information
+    """
+    result = subprocess.run(
+        [
+            ffprobe_path, "-v", "error", "-print_format", "json",
+            "-show_format", "-show_streams", "-select_streams", "a:0",
+            file_path
+        ],
+        capture_output=True,
+        timeout=FFPROBE_TIMEOUT,
+        check=True
+    )
+    probe = json.loads(result.stdout)
+    streams = probe.get("streams") or []
+    if not streams:
+        raise ValueError("No audio stream found")
+    
+    stream = streams[0]
+    fmt = probe.get("format", {})
+    duration = float(fmt.get("duration") or stream.get("duration") or 0)
+    sample_rate = int(stream.get("sample_rate") or 0)
+    return {
+        "duration": duration,
+        "sample_rate": sample_rate,
+        "channels": int(stream.get("channels") or 0),
+        "samples": int(duration * sample_rate),
+        "codec": stream.get("codec_name", "unknown"),
+        "format": fmt.get("format_name", "unknown")
+    }
+
 
 class ProductionAudioProcessor:
     """Production audio processor using only pydub (no Rust dependencies)."""
     
-    def __init__(self):
-        """Initialize audio processor."""
+    def __init__(self, cache: Optional[DiskCache] = None):
+        """
+        Initialize audio processor.
+        
+        Args:
+            cache: On-disk cache for processed audio, keyed by upload content hash
+        """
+        self.cache = cache
+        self._pool: Optional[ProcessPoolExecutor] = None
         self.target_sample_rate = 16000  # Optimal for Whisper API
         self.max_duration = 600  # 10 minutes max for single API call
+        self.ffmpeg_path = shutil.which("ffmpeg")
+        self.ffprobe_path = shutil.which("ffprobe")
+        self.output_extension, self.output_options = OUTPUT_FORMATS.get(
+            settings.PROCESSED_AUDIO_FORMAT, OUTPUT_FORMATS["wav"]
+        )
         self._ready = True
-        logger.info("Production Audio Processor initialized (pydub only)")
+        logger.info(f"Production Audio Processor initialized ({'ffmpeg' if self.ffmpeg_path else 'pydub only'})")
     
     def is_ready(self) -> bool:
         """Check if service is ready."""
         return self._ready
     
-    async def process_audio(self, file_path: str, session_id: str) -> str:
+    async def warm_up(self) -> bool:
+        """
+        Run ffmpeg and ffprobe once so the first upload doesn't pay for
+        loading the binaries and their shared libraries.
+        
+        Returns:
+            True if both binaries ran, False if they are missing or broken
+            (processing then falls back to pydub)
+        """
+        if not (self.ffmpeg_path and self.ffprobe_path):
+            return False
+        
+        try:
+            for binary in (self.ffmpeg_path, self.ffprobe_path):
+                returncode, stderr = await _run_ffmpeg([binary, "-hide_banner", "-version"])
+                if returncode != 0:
+                    logger.warning(f"{binary} -version failed: {stderr.decode(errors='replace').strip()}")
+                    return False
+        except (OSError, asyncio.TimeoutError) as e:
+            logger.warning(f"ffmpeg warm-up failed: {e}")
+            return False
+        
+        logger.info("ffmpeg warm-up completed")
+        return True
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Process pool for the pydub fallback, created on first use."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=settings.AUDIO_PROCESS_WORKERS)
+        return self._pool
+    
+    def close(self) -> None:
+        """Stop the pydub fallback's worker processes, if any were started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+    
+    async def process_audio(
+        self,
+        file_path: str,
+        session_id: str,
+        output_dir: Optional[str] = None,
+        cache_key: Optional[str] = None,
+        audio_info: Optional[dict] = None
+    ) -> str:
         """
-        Process audio file for optimal API transcription using pydub.
+        Process audio file for optimal API transcription.
+        
+        Trims silence, loudness-normalizes and converts to 16kHz mono with
+        ffmpeg, encoded as PROCESSED_AUDIO_FORMAT; falls back to pydub (WAV,
+        no silence trimming) when ffmpeg is missing or fails.
         
         Args:
             file_path: Path to input audio file
             session_id: Session identifier for output naming
+            output_dir: Directory for the processed file; a new temp
+                directory is created when omitted
+            cache_key: Content hash of the upload; identical uploads reuse
+                the cached processed audio
+            audio_info: Probe result from get_audio_info; input that is
+                already 16kHz mono PCM WAV with speech-range levels is used
+                without re-encoding
             
         Returns:
             Path to processed audio file
@@ -45,23 +347,57 @@ class ProductionAudioProcessor:
         try:
             logger.info(f"Processing audio file: {file_path}")
             
-            # Validate input file
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"Audio file not found: {file_path}")
-            
-            # Check file size
-            file_size = os.path.getsize(file_path)
+            # Validate input file (one stat, off the event loop; raises
+            # FileNotFoundError if it is missing)
+            file_size = (await asyncio.to_thread(os.stat, file_path)).st_size
             if file_size > settings.MAX_FILE_SIZE:
                 raise ValueError(f"File too large: {file_size} bytes")
             
-            # Run processing in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            processed_path = await loop.run_in_executor(
-                None, 
-                self._process_audio_sync,
-                file_path,
-                session_id
-            )
+            # Create output directory
+            if output_dir is None:
+                output_dir = await asyncio.to_thread(tempfile.mkdtemp, prefix="audio_proc_")
+            output_base = os.path.join(output_dir, f"{session_id}_processed")
+            output_path = f"{output_base}.{self.output_extension}"
+            
+            if (
+                audio_info
+                and self._is_transcription_ready(audio_info)
+                and await self._has_normalized_levels(file_path)
+            ):
+                logger.info("Audio is already 16kHz mono PCM at speech levels, skipping processing")
+                return await asyncio.to_thread(_link_or_copy, file_path, f"{output_base}.wav")
+            
+            cache_name = f"{cache_key}_16k.{self.output_extension}" if self.cache and cache_key else None
+            if cache_name:
+                cached_path = await asyncio.to_thread(self.cache.get_file, cache_name)
+                if cached_path:
+                    try:
+                        linked_path = await asyncio.to_thread(_link_or_copy, cached_path, output_path)
+                        logger.info(f"Using cached processed audio: {cached_path}")
+                        return linked_path
+                    except OSError as e:
+                        # Evicted since the lookup; process the upload instead
+                        logger.warning(f"Cached processed audio unavailable: {e}")
+            
+            # ffmpeg runs as a child process, so nothing blocks the event loop;
+            # only the pydub fallback needs the thread pool
+            if self.ffmpeg_path and await self._process_with_ffmpeg(file_path, output_path):
+                processed_path = output_path
+            else:
+                # pydub decodes and resamples in Python under the GIL, so it
+                # gets its own processes rather than the shared thread pool
+                loop = asyncio.get_running_loop()
+                processed_path = await loop.run_in_executor(
+                    self._get_pool(),
+                    _process_with_pydub,
+                    file_path,
+                    f"{output_base}.wav",
+                    self.target_sample_rate,
+                    self.max_duration
+                )
+            
+            if cache_name and processed_path == output_path:
+                await asyncio.to_thread(self.cache.put_file, cache_name, output_path)
             
             logger.info(f"Audio processing completed: {processed_path}")
             return processed_path
@@ -71,59 +407,198 @@ class ProductionAudioProcessor:
             # Return original file if processing fails (better than crashing)
             return file_path
     
-    def _process_audio_sync(self, file_path: str, session_id: str) -> str:
-        """Synchronous audio processing implementation using pydub."""
+    async def probe_and_process(
+        self,
+        file_path: str,
+        session_id: str,
+        output_dir: Optional[str] = None,
+        max_duration: Optional[float] = None,
+        cache_key: Optional[str] = None
+    ) -> Tuple[dict, Optional[str]]:
+        """
+        Probe an upload once and, if it is usable, process it for transcription.
         
-        # Create output directory
-        output_dir = tempfile.mkdtemp(prefix="audio_proc_")
-        output_path = os.path.join(output_dir, f"{session_id}_processed.wav")
+        The probe doubles as validation, replacing separate
+        validate_audio_file / get_audio_info calls before process_audio.
         
-        try:
-            logger.debug("Processing with pydub")
-            
-            # Load audio with pydub
-            audio = AudioSegment.from_file(file_path)
-            
-            # Validate audio data
-            if len(audio) == 0:
-                raise ValueError("Empty audio data")
-            
-            # Convert to mono if stereo
-            if audio.channels > 1:
-                audio = audio.set_channels(1)
-            
-            # Set sample rate to 16kHz (optimal for Whisper)
-            audio = audio.set_frame_rate(self.target_sample_rate)
+        Args:
+            file_path: Path to input audio file
+            session_id: Session identifier for output naming
+            output_dir: Directory for the processed file
+            max_duration: Reject audio longer than this many seconds
+            cache_key: Content hash of the upload, see process_audio
             
-            # Check duration and split if too long
-            duration = len(audio) / 1000.0  # Convert ms to seconds
-            if duration > self.max_duration:
-                logger.warning(f"Audio duration {duration:.1f}s exceeds maximum {self.max_duration}s")
-                # Truncate to max duration
-                max_ms = int(self.max_duration * 1000)
-                audio = audio[:max_ms]
+        Returns:
+            Tuple of (audio info, processed path). The path is None when the
+            file is not valid audio or is too long; the info tells which.
+        """
+        audio_info = await asyncio.to_thread(self.get_audio_info, file_path)
+        
+        if "error" in audio_info or audio_info["duration"] <= 0:
+            return audio_info, None
+        if max_duration is not None and audio_info["duration"] > max_duration:
+            return audio_info, None
+        
+        processed_path = await self.process_audio(
+            file_path, session_id, output_dir, cache_key, audio_info
+        )
+        return audio_info, processed_path
+    
+    def _is_transcription_ready(self, audio_info: dict) -> bool:
+        """Whether probed audio already matches the processed output format."""
+        return (
+            audio_info.get("codec") == "pcm_s16le"
+            and audio_info.get("sample_rate") == self.target_sample_rate
+            and audio_info.get("channels") == 1
+            and 0 < audio_info.get("duration", 0) <= self.max_duration
+        )
+    
+    async def _has_normalized_levels(self, file_path: str) -> bool:
+        """
+        Whether audio levels are close enough to loudnorm's output to skip it.
+        
+        Runs ffmpeg's volumedetect, which only decodes and measures, so it is
+        far cheaper than the full preprocessing pass. Without ffmpeg, or if
+        the measurement fails, the audio is treated as needing processing.
+        
+        Args:
+            file_path: Path to input audio file
             
-            # Normalize volume
-            audio = audio.normalize()
+        Returns:
+            True if mean and peak volume are within the READY_* bounds
+        """
+        if not self.ffmpeg_path:
+            return False
+        
+        try:
+            _, stderr = await _run_ffmpeg([
+                self.ffmpeg_path, "-nostdin", "-hide_banner", "-i", file_path,
+                "-af", "volumedetect", "-f", "null", "-"
+            ])
+        except (OSError, asyncio.TimeoutError) as e:
+            logger.warning(f"Volume detection failed: {e}")
+            return False
+        
+        levels = {kind: float(value) for kind, value in _VOLUME_RE.findall(stderr.decode(errors="replace"))}
+        if "mean" not in levels or "max" not in levels:
+            return False
+        
+        low, high = READY_MEAN_VOLUME_RANGE
+        return low <= levels["mean"] <= high and levels["max"] <= READY_MAX_VOLUME
+    
+    async def _process_with_ffmpeg(self, file_path: str, output_path: str) -> bool:
+        """
+        Trim silence, normalize, resample to 16kHz mono and encode in one ffmpeg run.
+        
+        Args:
+            file_path: Path to input audio file
+            output_path: Path for the processed audio
             
-            # Export as WAV for consistent format
-            audio.export(output_path, format="wav")
+        Returns:
+            True if ffmpeg produced the output, False otherwise
+        """
+        command = [
+            self.ffmpeg_path, "-nostdin", "-hide_banner", "-loglevel", "error", "-y",
+            "-i", file_path,
+            "-t", str(self.max_duration),
+            "-af", PREPROCESS_FILTER,
+            "-ac", "1",
+            "-ar", str(self.target_sample_rate),
+            *self.output_options, output_path
+        ]
+        try:
+            logger.debug("Processing with ffmpeg")
+            returncode, stderr = await _run_ffmpeg(command)
+        except OSError as e:
+            logger.warning(f"ffmpeg processing failed, falling back to pydub: {e}")
+            return False
+        except asyncio.TimeoutError:
+            logger.warning(f"ffmpeg timed out after {FFMPEG_TIMEOUT}s, falling back to pydub")
+            return False
+        
+        if returncode != 0 or not os.path.exists(output_path):
+            logger.warning(f"ffmpeg processing failed, falling back to pydub: {stderr.decode(errors='replace').strip()}")
+            return False
+        
+        logger.debug(f"ffmpeg processing successful: {output_path}")
+        return True
+    
+    async def split_on_silence(
+        self,
+        file_path: str,
+        output_dir: str,
+        chunk_seconds: float
+    ) -> List[Tuple[str, float]]:
+        """
+        Split processed audio into ~chunk_seconds pieces cut at pauses.
+        
+        The pieces can be transcribed in parallel and stitched back together
+        using their start offsets. Audio that is short, or that cannot be
+        split (no ffmpeg, probe or split failure), is returned as one chunk.
+        
+        Args:
+            file_path: Path to processed audio file
+            output_dir: Directory for the chunk files
+            chunk_seconds: Target chunk length; 0 disables splitting
             
-            # Verify output file was created
-            if not os.path.exists(output_path):
-                raise RuntimeError("Failed to create output file")
+        Returns:
+            List of (chunk path, start offset in seconds)
+        """
+        whole = [(file_path, 0.0)]
+        if not self.ffmpeg_path or chunk_seconds <= 0:
+            return whole
+        
+        audio_info = await asyncio.to_thread(self.get_audio_info, file_path)
+        duration = audio_info.get("duration", 0)
+        if duration <= chunk_seconds * 1.5:
+            return whole
+        
+        try:
+            # Find pauses
+            _, stderr = await _run_ffmpeg([
+                self.ffmpeg_path, "-nostdin", "-hide_banner", "-i", file_path,
+                "-af", SILENCE_DETECT_FILTER, "-f", "null", "-"
+            ])
+            silences = []
+            silence_start = None
+            for kind, value in _SILENCE_RE.findall(stderr.decode(errors="replace")):
+                if kind == "start":
+                    silence_start = float(value)
+                elif silence_start is not None:
+                    silences.append((silence_start + float(value)) / 2)
+                    silence_start = None
             
-            logger.debug(f"Pydub processing successful: {output_path}")
-            return output_path
+            cuts = _choose_cut_points(duration, silences, chunk_seconds)
+            if not cuts:
+                return whole
             
-        except Exception as e:
-            logger.error(f"Audio processing failed: {e}")
-            # If processing fails, return original file
-            return file_path
+            # Cut all chunks in one pass without re-encoding
+            base, extension = os.path.splitext(os.path.basename(file_path))
+            pattern = os.path.join(output_dir, f"{base}_chunk%03d{extension}")
+            returncode, stderr = await _run_ffmpeg([
+                self.ffmpeg_path, "-nostdin", "-hide_banner", "-loglevel", "error", "-y",
+                "-i", file_path, "-c", "copy",
+                "-f", "segment", "-segment_times", ",".join(f"{cut:.3f}" for cut in cuts),
+                "-reset_timestamps", "1", pattern
+            ])
+        except (OSError, asyncio.TimeoutError) as e:
+            logger.warning(f"Audio split failed, transcribing as one file: {e}")
+            return whole
+        
+        chunks = [(pattern % i, offset) for i, offset in enumerate([0.0] + cuts)]
+        if returncode != 0 or not all(os.path.exists(path) for path, _ in chunks):
+            logger.warning(f"Audio split failed, transcribing as one file: {stderr.decode(errors='replace').strip()}")
+            return whole
+        
+        logger.info(f"Split {duration:.1f}s of audio into {len(chunks)} chunks")
+        return chunks
     
     def get_audio_info(self, file_path: str) -> dict:
         """
-        Get audio file information using pydub.
+        Get audio file information.
+        
+        Reads container metadata with ffprobe when available; otherwise the
+        file is decoded with pydub.
         
         Args:
             file_path: Path to audio file
@@ -131,7 +606,16 @@ class ProductionAudioProcessor:
         Returns:
             Dictionary with audio information
         """
+        if self.ffprobe_path:
+            try:
+                stat = os.stat(file_path)
+                return dict(_probe_audio(self.ffprobe_path, file_path, stat.st_mtime_ns, stat.st_size))
+            except Exception as e:
+                logger.warning(f"ffprobe failed, falling back to pydub: {e}")
+        
         try:
+            from pydub import AudioSegment
+            
             audio = AudioSegment.from_file(file_path)
             return {
                 "duration": len(audio) / 1000.0,  # Convert ms to seconds
@@ -153,7 +637,11 @@ class ProductionAudioProcessor:
     
     def validate_audio_file(self, file_path: str) -> bool:
         """
-        Validate that the file is a proper audio file using pydub.
+        Validate that the file is a proper audio file.
+        
+        Recognized container signatures are accepted from the first bytes
+        alone; anything else must have an audio stream according to ffprobe
+        (or decode with pydub when ffprobe is missing).
         
         Args:
             file_path: Path to audio file
@@ -162,15 +650,24 @@ class ProductionAudioProcessor:
             True if valid audio file, False otherwise
         """
         try:
-            # Check if file exists
-            if not os.path.exists(file_path):
-                return False
+            with open(file_path, "rb") as f:
+                header = f.read(16)
             
-            # Check file size
-            if os.path.getsize(file_path) == 0:
+            # Empty or truncated file
+            if len(header) < 12:
                 return False
             
+            if _sniff_audio_format(header):
+                return True
+            
+            if self.ffprobe_path:
+                stat = os.stat(file_path)
+                info = _probe_audio(self.ffprobe_path, file_path, stat.st_mtime_ns, stat.st_size)
+                return info["duration"] > 0
+            
             # Try to load with pydub
+            from pydub import AudioSegment
+            
             audio = AudioSegment.from_file(file_path)
             return len(audio) > 0
                     
@@ -189,8 +686,7 @@ class ProductionAudioProcessor:
                 os.remove(file_path)
                 logger.debug(f"Cleaned up file: {file_path}")
             elif os.path.isdir(file_path):
-                import shutil
-                shutil.rmtree(file_path)
+                shutil.rmtree(file_path, ignore_errors=True)
                 logger.debug(f"Cleaned up directory: {file_path}")
         except Exception as e:
             logger.warning(f"Failed to cleanup {file_path}: {e}")
@@ -0,0 +1,240 @@
+"""
+Tracking for analyses submitted through the OpenAI Batch API.
+"""
+
+import time
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Set
+
+import orjson
+
+from app.models.schemas import (
+    AnalysisResponse, SessionStatusResponse, ProcessingStatus, TranscriptSegment
+)
+from app.utils.cache import DiskCache, TTLCache
+from app.utils.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Terminal OpenAI batch states that will never produce results
+FAILED_BATCH_STATES = {"failed", "expired", "cancelled"}
+
+# Consecutive failed status checks after which a job is marked failed
+MAX_POLL_ERRORS = 5
+
+
+class BatchJobManager:
+    """
+    Track non-interactive analyses and poll their OpenAI batches to completion.
+    
+    Job records (status and, once completed, the analysis) are kept in a
+    DiskCache directory shared by every worker process on the host, so a
+    status or result request can land on any worker; the batch itself is
+    polled by the worker that accepted the upload. The directory is
+    size-capped and finished jobs expire after ``result_ttl``.
+    """
+    
+    def __init__(
+        self,
+        store: DiskCache,
+        poll_interval: float = 30.0,
+        max_poll_interval: float = 600.0,
+        result_ttl: float = 24 * 3600
+    ):
+        """
+        Initialize job manager.
+        
+        Args:
+            store: Shared directory holding the job records
+            poll_interval: Seconds before the first batch status check
+            max_poll_interval: Upper bound for the doubling delay between checks
+            result_ttl: Seconds a finished job stays queryable
+        """
+        self.store = store
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.result_ttl = result_ttl
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def submit(
+        self,
+        session_id: str,
+        filename: str,
+        content_hash: str,
+        submission: Dict[str, Any],
+        analyzer,
+        transcript_segments: List[TranscriptSegment],
+        result_cache: TTLCache
+    ) -> SessionStatusResponse:
+        """
+        Register a submitted batch and start polling it.
+        
+        Args:
+            session_id: Session identifier
+            filename: Original filename
+            content_hash: Content hash of the upload, the result_cache key
+            submission: Return value of the analyzer's submit_batch_analysis
+            analyzer: NLP analyzer used to poll and fetch the batch
+            transcript_segments: Transcript the batch analyzes
+            result_cache: Analysis cache the completed result is stored in
+            
+        Returns:
+            Initial session status
+        """
+        job = {
+            "status": ProcessingStatus.PROCESSING.value,
+            "filename": filename,
+            "batch_id": submission["batch_id"],
+            "submitted_at": time.time(),
+            "finished_at": None,
+            "message": "Analysis queued with OpenAI Batch API",
+            "result": None
+        }
+        await self._save_job(session_id, job)
+        
+        task = asyncio.create_task(
+            self._poll(
+                session_id, job, submission, analyzer, transcript_segments,
+                content_hash, result_cache
+            )
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        
+        return self._status_response(session_id, job)
+    
+    async def get_status(self, session_id: str) -> Optional[SessionStatusResponse]:
+        """Return the status of a batch job, or None if it is unknown or expired."""
+        job = await self._load_job(session_id)
+        return self._status_response(session_id, job) if job else None
+    
+    async def get_result(self, session_id: str) -> Optional[AnalysisResponse]:
+        """Return the analysis of a completed batch job, or None."""
+        job = await self._load_job(session_id)
+        if not job or job["result"] is None:
+            return None
+        return AnalysisResponse.model_validate(job["result"])
+    
+    def _status_response(self, session_id: str, job: Dict[str, Any]) -> SessionStatusResponse:
+        """Build the API status of a job record."""
+        completed = job["status"] == ProcessingStatus.COMPLETED.value
+        return SessionStatusResponse(
+            session_id=session_id,
+            status=job["status"],
+            progress=100.0 if completed else 50.0,
+            message=job["message"],
+            results_available=completed
+        )
+    
+    async def _save_job(self, session_id: str, job: Dict[str, Any]) -> None:
+        """Write a job record to the shared store."""
+        await asyncio.to_thread(self.store.set_bytes, f"{session_id}.json", orjson.dumps(job))
+    
+    async def _load_job(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Read a job record from the shared store, or None if it is unknown or expired."""
+        data = await asyncio.to_thread(self.store.get_bytes, f"{session_id}.json")
+        if data is None:
+            return None
+        try:
+            job = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return None
+        
+        finished_at = job.get("finished_at")
+        if finished_at is not None and time.time() - finished_at > self.result_ttl:
+            return None
+        return job
+    
+    async def _poll(
+        self,
+        session_id: str,
+        job: Dict[str, Any],
+        submission: Dict[str, Any],
+        analyzer,
+        transcript_segments: List[TranscriptSegment],
+        content_hash: str,
+        result_cache: TTLCache
+    ) -> None:
+        """
+        Wait for a batch to finish and store its analysis.
+        
+        A submission whose tasks were all cached has no batch and completes
+        straight away.
+        """
+        batch_id = submission["batch_id"]
+        
+        try:
+            batch = None
+            if batch_id is not None:
+                batch = await self._wait_for_batch(batch_id, analyzer)
+                status = batch.get("status")
+                if status in FAILED_BATCH_STATES:
+                    job["status"] = ProcessingStatus.FAILED.value
+                    job["message"] = f"Batch {status}"
+                    logger.error(f"Batch {batch_id} for session {session_id} {status}")
+                    return
+            
+            analysis_result = await analyzer.get_batch_analysis(batch, transcript_segments, submission)
+            # Same rule as interactive analyses: only complete results are cached
+            if not analysis_result.pop("fallback", False):
+                result_cache.set(content_hash, analysis_result)
+            
+            response = AnalysisResponse(
+                session_id=session_id,
+                filename=job["filename"],
+                **{**analysis_result, "processing_time": round(time.time() - job["submitted_at"], 2)}
+            )
+            job["result"] = response.model_dump(mode="json")
+            job["status"] = ProcessingStatus.COMPLETED.value
+            job["message"] = "Analysis completed"
+            logger.info(f"Batch analysis completed for session: {session_id}")
+            
+        except Exception as e:
+            logger.error(f"Batch analysis for session {session_id} failed: {e}")
+            job["status"] = ProcessingStatus.FAILED.value
+            job["message"] = "Batch analysis failed"
+        finally:
+            job["finished_at"] = time.time()
+            await self._save_job(session_id, job)
+    
+    async def _wait_for_batch(self, batch_id: str, analyzer) -> Dict[str, Any]:
+        """
+        Poll a batch until it reaches a terminal state.
+        
+        Batches take minutes to hours, so the delay between checks doubles
+        up to max_poll_interval; failed checks are retried on the same
+        schedule rather than failing the job straight away.
+        
+        Returns:
+            The completed or failed batch object
+        """
+        delay = self.poll_interval
+        poll_errors = 0
+        
+        while True:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_poll_interval)
+            
+            try:
+                batch = await analyzer.get_batch(batch_id)
+            except Exception as e:
+                poll_errors += 1
+                if poll_errors >= MAX_POLL_ERRORS:
+                    raise
+                logger.warning(f"Checking batch {batch_id} failed ({poll_errors}/{MAX_POLL_ERRORS}): {e}")
+                continue
+            poll_errors = 0
+            
+            status = batch.get("status")
+            if status == "completed" or status in FAILED_BATCH_STATES:
+                return batch
+
+
+batch_job_manager = BatchJobManager(
+    DiskCache(settings.BATCH_JOBS_DIR, settings.BATCH_JOBS_MAX_MB * 1024 * 1024),
+    poll_interval=settings.BATCH_POLL_INTERVAL,
+    max_poll_interval=settings.BATCH_POLL_MAX_INTERVAL,
+    result_ttl=settings.BATCH_RESULT_TTL
+)
@@ -0,0 +1,97 @@
+"""
+Request batching for API calls issued by concurrent requests.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBatcher:
+    """
+    Collect concurrent submissions and hand them to a handler in batches.
+    
+    A batch is flushed once it holds ``max_batch_size`` items or ``max_wait``
+    seconds after its first item arrived, whichever comes first. The handler
+    receives the list of items and must return one result per item, in order;
+    a result that is an exception is raised to that item's caller only.
+    """
+    
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch_size: int = 8,
+        max_wait: float = 0.25
+    ):
+        """
+        Initialize batcher.
+        
+        Args:
+            handler: Coroutine function processing a list of items
+            max_batch_size: Maximum number of items per batch
+            max_wait: Maximum seconds an item waits for its batch to fill
+        """
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def submit(self, item: Any) -> Any:
+        """
+        Queue an item and wait for its result.
+        
+        Args:
+            item: Item passed to the handler as part of a batch
+            
+        Returns:
+            The handler's result for this item
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        
+        return await future
+    
+    def _flush(self) -> None:
+        """Dispatch everything queued so far as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        
+        task = asyncio.create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Run the handler for a batch and resolve each caller's future."""
+        try:
+            results = await self.handler([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Batch handler returned {len(results)} results for {len(batch)} items")
+        except Exception as e:
+            logger.error(f"Batch of {len(batch)} items failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,199 @@
+"""
+Adaptive client-side rate limiting for API calls.
+"""
+
+import re
+import time
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Durations in OpenAI's x-ratelimit-reset-* headers, e.g. "20ms", "1s", "6m0s"
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+# Remaining-quota fraction below which concurrency is cut back
+LOW_QUOTA_FRACTION = 0.1
+
+
+def _parse_duration(value: Optional[str]) -> Optional[float]:
+    """Parse a rate-limit duration header into seconds."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    matches = _DURATION_RE.findall(value)
+    if not matches:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in matches)
+
+
+def _remaining_fraction(headers: Mapping[str, str], kind: str) -> Optional[float]:
+    """Fraction of the requests or tokens quota left, from x-ratelimit-* headers."""
+    try:
+        remaining = int(headers[f"x-ratelimit-remaining-{kind}"])
+        limit = int(headers[f"x-ratelimit-limit-{kind}"])
+    except (KeyError, ValueError):
+        return None
+    return remaining / limit if limit > 0 else None
+
+
+class AdaptiveRateLimiter:
+    """
+    AIMD concurrency control plus header-driven backpressure for one API.
+    
+    The number of requests allowed in flight grows by ``increase`` after each
+    success that came back within ``target_latency`` and is multiplied by
+    ``decrease`` on a 429, a 5xx or a timeout, so the limit settles just below
+    what the provider accepts instead of every caller hitting 429 at once.
+    Responses' ``x-ratelimit-*`` headers cut it back early when less than 10%
+    of the request or token quota is left, and ``Retry-After`` (or an
+    exhausted quota's reset time) pauses all new requests until then.
+    Optional sliding windows also keep requests and estimated tokens under
+    known RPM/TPM limits.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int = 32,
+        initial_concurrency: int = 8,
+        min_concurrency: int = 1,
+        target_latency: float = 30.0,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0
+    ):
+        """
+        Initialize limiter.
+        
+        Args:
+            name: Name used in log messages
+            max_concurrency: Upper bound for requests in flight
+            initial_concurrency: Requests allowed in flight at start
+            min_concurrency: Lower bound for requests in flight
+            target_latency: Seconds; slower successes do not grow the limit
+            increase: Additive increase per fast success
+            decrease: Multiplicative decrease on overload
+            requests_per_minute: Proactive RPM cap; 0 relies on headers only
+            tokens_per_minute: Proactive TPM cap on estimated tokens; 0 relies on headers only
+        """
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.target_latency = target_latency
+        self.increase = increase
+        self.decrease = decrease
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.limit = float(min(max(initial_concurrency, min_concurrency), max_concurrency))
+        self._in_flight = 0
+        self._blocked_until = 0.0
+        # (send time, estimated tokens) of requests in the last minute
+        self._sent: Deque[Tuple[float, int]] = deque()
+        self._sent_tokens = 0
+        self._condition: Optional[asyncio.Condition] = None
+    
+    @asynccontextmanager
+    async def slot(self, tokens: int = 0) -> AsyncIterator[None]:
+        """
+        Wait for permission to send one request.
+        
+        Call record() with the response before leaving the block.
+        
+        Args:
+            tokens: Estimated tokens the request uses, for the TPM window
+        """
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        try:
+            await self._wait_if_throttled(tokens)
+            yield
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+    
+    async def _wait_if_throttled(self, tokens: int) -> None:
+        """Sleep while a Retry-After is pending or the RPM/TPM window is full."""
+        # A request larger than the whole TPM budget only waits for an empty window
+        if self.tokens_per_minute > 0:
+            tokens = min(tokens, self.tokens_per_minute)
+        
+        while True:
+            now = time.monotonic()
+            delay = self._blocked_until - now
+            
+            while self._sent and now - self._sent[0][0] >= 60.0:
+                self._sent_tokens -= self._sent.popleft()[1]
+            if self._sent:
+                window_free_in = 60.0 - (now - self._sent[0][0])
+                if 0 < self.requests_per_minute <= len(self._sent):
+                    delay = max(delay, window_free_in)
+                if 0 < self.tokens_per_minute < self._sent_tokens + tokens:
+                    delay = max(delay, window_free_in)
+            
+            if delay <= 0:
+                if self.requests_per_minute > 0 or self.tokens_per_minute > 0:
+                    self._sent.append((now, tokens))
+                    self._sent_tokens += tokens
+                return
+            await asyncio.sleep(delay)
+    
+    def record(self, status_code: Optional[int], headers: Mapping[str, str], latency: float) -> None:
+        """
+        Adjust the limit from a finished request.
+        
+        Args:
+            status_code: Response status, or None if the request timed out
+            headers: Response headers
+            latency: Seconds the request took
+        """
+        if status_code is None or status_code == 429 or status_code >= 500:
+            retry_after = _parse_duration(headers.get("retry-after"))
+            if retry_after:
+                self._block_for(retry_after)
+            self._shrink(f"status {status_code or 'timeout'}")
+            return
+        
+        if status_code >= 400:
+            return
+        
+        fractions = [
+            fraction for fraction in (
+                _remaining_fraction(headers, "requests"),
+                _remaining_fraction(headers, "tokens")
+            )
+            if fraction is not None
+        ]
+        if fractions and min(fractions) < LOW_QUOTA_FRACTION:
+            if min(fractions) == 0:
+                resets = [
+                    _parse_duration(headers.get(f"x-ratelimit-reset-{kind}"))
+                    for kind in ("requests", "tokens")
+                ]
+                self._block_for(max((reset for reset in resets if reset), default=0.0))
+            self._shrink("rate limit quota almost used")
+        elif latency <= self.target_latency:
+            self.limit = min(self.max_concurrency, self.limit + self.increase)
+    
+    def _shrink(self, reason: str) -> None:
+        """Multiplicative decrease of the concurrency limit."""
+        self.limit = max(self.min_concurrency, self.limit * self.decrease)
+        logger.warning(f"{self.name} concurrency reduced to {int(self.limit)} ({reason})")
+    
+    def _block_for(self, seconds: float) -> None:
+        """Hold back new requests for ``seconds``."""
+        if seconds > 0:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
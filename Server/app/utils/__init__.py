@@ -3,6 +3,7 @@ Utilities package for the Meeting Analysis API.
 """
 
 from .config import get_settings, Settings
+from .cache import TTLCache, DiskCache, content_hasher
 from .file_handler import (
     validate_audio_file,
     cleanup_temp_files,
@@ -17,6 +18,9 @@ from .file_handler import (
 __all__ = [
     "get_settings",
     "Settings",
+    "TTLCache",
+    "DiskCache",
+    "content_hasher",
     "validate_audio_file",
     "cleanup_temp_files", 
     "get_file_info",
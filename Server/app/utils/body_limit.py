@@ -0,0 +1,99 @@
+"""
+ASGI middleware rejecting oversized request bodies before they are parsed.
+"""
+
+import orjson
+from fastapi import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class _BodyTooLarge(HTTPException):
+    """
+    Raised from ``receive`` once a streamed body passes the limit.
+    
+    An HTTPException, so when it surfaces while FastAPI parses the body the
+    app's exception handler turns it into a normal 413 response.
+    """
+    
+    def __init__(self, max_body_size: int):
+        super().__init__(status_code=413, detail=_too_large_message(max_body_size))
+
+
+def _too_large_message(max_body_size: int) -> str:
+    return f"Request too large. Maximum size: {max_body_size / 1024 / 1024:.1f}MB"
+
+
+class MaxBodySizeMiddleware:
+    """
+    Reject request bodies larger than ``max_body_size`` with a 413.
+    
+    FastAPI parses the whole multipart body into an UploadFile before the
+    endpoint runs, so size checks in the route only fire after the upload
+    has been received and spooled. This checks the declared Content-Length
+    up front and counts bytes of chunked bodies as they arrive.
+    """
+    
+    def __init__(self, app: ASGIApp, max_body_size: int):
+        """
+        Initialize middleware.
+        
+        Args:
+            app: Wrapped ASGI application
+            max_body_size: Maximum request body size in bytes
+        """
+        self.app = app
+        self.max_body_size = max_body_size
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > self.max_body_size:
+                    await self._reject(send)
+                    return
+                break
+        
+        received = 0
+        response_started = False
+        
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    raise _BodyTooLarge(self.max_body_size)
+            return message
+        
+        async def tracking_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, limited_receive, tracking_send)
+        except _BodyTooLarge:
+            if not response_started:
+                await self._reject(send)
+    
+    async def _reject(self, send: Send) -> None:
+        """Send the 413 response, in the same shape as the API's other errors."""
+        body = orjson.dumps({
+            "error": "HTTP Error",
+            "message": _too_large_message(self.max_body_size),
+            "status_code": 413
+        })
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"connection", b"close")
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,223 @@
+"""
+In-process and on-disk caching utilities.
+"""
+
+import os
+import time
+import uuid
+import shutil
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+logger = logging.getLogger(__name__)
+
+
+def content_hasher():
+    """
+    Create a hasher for content-addressed cache keys.
+    
+    Uses SIMD/multithreaded BLAKE3 when installed, otherwise the stdlib's
+    BLAKE2b; both are much faster than SHA-256 on large uploads.
+    
+    Returns:
+        Object with hashlib-style ``update``/``hexdigest`` methods
+    """
+    if blake3 is not None:
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return hashlib.blake2b(digest_size=32)
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after a fixed time-to-live."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept before evicting the oldest
+            ttl: Entry lifetime in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        """Return the cached value for ``key``, or ``default`` if missing/expired."""
+        item = self._data.get(key)
+        if item is None:
+            return default
+        
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+        
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting least recently used entries."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCache:
+    """
+    Size-capped directory of cached files.
+    
+    Entries are written atomically and evicted least recently used first,
+    using mtime as the access time. All methods do blocking file I/O; call
+    them from a worker thread in async code.
+    
+    Writes keep a running byte total, so the directory is only scanned when
+    that total passes ``max_bytes`` or the last scan is older than
+    ``rescan_interval`` (other workers write to the same directory).
+    """
+    
+    def __init__(self, directory: str, max_bytes: int, rescan_interval: float = 300.0):
+        """
+        Initialize cache.
+        
+        Args:
+            directory: Cache directory, created if missing
+            max_bytes: Total size above which the oldest entries are evicted
+            rescan_interval: Seconds after which a write rescans the directory
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.rescan_interval = rescan_interval
+        os.makedirs(directory, exist_ok=True)
+        # Size of the directory as of the last scan plus this process's writes
+        self._total_bytes: Optional[int] = None
+        self._scanned_at = 0.0
+        self._lock = threading.Lock()
+    
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+    
+    def get_file(self, name: str) -> Optional[str]:
+        """Return the path of cached file ``name`` (marking it as used), or None."""
+        path = self._path(name)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+    
+    def put_file(self, name: str, src_path: str) -> None:
+        """Store a copy of ``src_path`` as ``name``, hard-linking when possible."""
+        tmp_path = self._path(f".{name}.{uuid.uuid4().hex}.tmp")
+        try:
+            try:
+                os.link(src_path, tmp_path)
+            except OSError:
+                shutil.copyfile(src_path, tmp_path)
+            self._replace(tmp_path, name)
+        except OSError as e:
+            logger.warning(f"Failed to cache {name}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        self._trim_if_needed()
+    
+    def get_bytes(self, name: str) -> Optional[bytes]:
+        """Return the contents of cached entry ``name``, or None if missing/unreadable."""
+        path = self.get_file(name)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def set_bytes(self, name: str, data: bytes) -> None:
+        """Store ``data`` as entry ``name``."""
+        tmp_path = self._path(f".{name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            self._replace(tmp_path, name)
+        except OSError as e:
+            logger.warning(f"Failed to cache {name}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        self._trim_if_needed()
+    
+    def _replace(self, tmp_path: str, name: str) -> None:
+        """Move a written temp file into place as ``name``, updating the running total."""
+        path = self._path(name)
+        added = os.stat(tmp_path).st_size
+        try:
+            added -= os.stat(path).st_size
+        except OSError:
+            pass
+        os.replace(tmp_path, path)
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += added
+    
+    def _trim_if_needed(self) -> None:
+        """Run trim() when the running total is over budget or stale."""
+        with self._lock:
+            due = (
+                self._total_bytes is None
+                or self._total_bytes > self.max_bytes
+                or time.monotonic() - self._scanned_at > self.rescan_interval
+            )
+        if due:
+            self.trim()
+    
+    def trim(self) -> None:
+        """Evict least recently used entries until the cache fits in ``max_bytes``."""
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.startswith(".") or not entry.is_file(follow_symlinks=False):
+                        continue
+                    stat = entry.stat(follow_symlinks=False)
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        except OSError as e:
+            logger.warning(f"Failed to scan cache directory: {e}")
+            return
+        
+        if total > self.max_bytes:
+            entries.sort()
+            for _, size, path in entries:
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                if total <= self.max_bytes:
+                    break
+        
+        with self._lock:
+            self._total_bytes = total
+            self._scanned_at = time.monotonic()
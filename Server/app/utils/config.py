@@ -3,8 +3,31 @@ Configuration management - NO PYDANTIC.
 """
 
 import os
-from functools import lru_cache
-from typing import List
+from typing import Any, Callable, Dict, FrozenSet, Tuple
+
+
+# Settings only some deployments or code paths read, parsed on first access:
+# attribute -> (environment variable, parser, default)
+_LAZY_FIELDS: Dict[str, Tuple[str, Callable[[str], Any], str]] = {
+    # RAM-backed upload directory (USE_TMPFS or small uploads)
+    "TMPFS_DIR": ("TMPFS_DIR", str, "/dev/shm/manthan"),
+    "TMPFS_MIN_FREE_MB": ("TMPFS_MIN_FREE_MB", int, "512"),
+    # Processes per worker for the pydub fallback (unused when ffmpeg is installed)
+    "AUDIO_PROCESS_WORKERS": ("AUDIO_PROCESS_WORKERS", int, "2"),
+}
+
+# Parts of the logging dictConfig that do not depend on settings
+_LOG_CONFIG_TEMPLATE = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "default": {
+            "formatter": "default",
+            "class": "logging.StreamHandler",
+            "stream": "ext://sys.stdout",
+        },
+    },
+}
 
 
 class Settings:
@@ -24,31 +47,117 @@ class Settings:
         self.HOST = os.getenv("HOST", "127.0.0.1")
         self.PORT = int(os.getenv("PORT", "8000"))
         self.ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS","https://manthan-ai-brown.vercel.app")
+        self.ALLOWED_HOSTS = os.getenv("ALLOWED_HOSTS", "*")
         
         # File handling
         self.MAX_FILE_SIZE = 25 * 1024 * 1024  # 25MB
+        # Whole request body limit; headroom over MAX_FILE_SIZE for multipart framing and form fields
+        self.MAX_REQUEST_SIZE = self.MAX_FILE_SIZE + 1024 * 1024
         self.MAX_AUDIO_DURATION = 600  # 10 minutes
-        self.SUPPORTED_FORMATS = "mp3,wav,mp4,m4a,ogg,flac"
+        self.SUPPORTED_FORMATS = "mp3,wav,mp4,m4a,ogg,flac,webm"
         self.TEMP_DIR = "/tmp/meeting_analysis"
         
+        # Put per-request uploads on RAM-backed /dev/shm when it is mounted
+        self.USE_TMPFS = os.getenv("USE_TMPFS", "false").lower() == "true"
+        # Uploads up to this size use a tmpfs session directory even without USE_TMPFS; 0 disables
+        self.SMALL_UPLOAD_MAX_BYTES = int(os.getenv("SMALL_UPLOAD_MAX_BYTES", str(2 * 1024 * 1024)))
+        
+        # Codec for audio sent to Whisper: opus (smallest), flac (lossless) or wav
+        self.PROCESSED_AUDIO_FORMAT = os.getenv("PROCESSED_AUDIO_FORMAT", "opus").lower()
+        
+        # Per-worker limit on uploads being decoded/processed at once
+        self.ANALYZE_CONCURRENCY = int(os.getenv("ANALYZE_CONCURRENCY", "2"))
+        self.ANALYZE_QUEUE_LIMIT = int(os.getenv("ANALYZE_QUEUE_LIMIT", "8"))
+        self.ANALYZE_RETRY_AFTER = int(os.getenv("ANALYZE_RETRY_AFTER", "30"))
+        
+        # Caching
+        self.ANALYSIS_CACHE_TTL = int(os.getenv("ANALYSIS_CACHE_TTL", str(6 * 3600)))  # 6 hours
+        self.ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "128"))
+        # Processed audio and transcripts on disk, shared by workers; 0 disables
+        self.AUDIO_CACHE_DIR = os.getenv("AUDIO_CACHE_DIR", os.path.join(self.TEMP_DIR, "audio_cache"))
+        self.AUDIO_CACHE_MAX_MB = int(os.getenv("AUDIO_CACHE_MAX_MB", "1024"))
+        
+        # Answer summary, action items, decisions, sentiment and topics with one
+        # GPT call instead of five; tasks it fails on are retried individually
+        self.ENABLE_COMBINED_ANALYSIS = os.getenv("ENABLE_COMBINED_ANALYSIS", "true").lower() == "true"
+        
+        # Batch summaries of short meetings arriving together into one GPT call
+        self.ENABLE_SUMMARY_BATCHING = os.getenv("ENABLE_SUMMARY_BATCHING", "false").lower() == "true"
+        self.SUMMARY_BATCH_MAX_SIZE = int(os.getenv("SUMMARY_BATCH_MAX_SIZE", "8"))
+        self.SUMMARY_BATCH_MAX_WAIT_MS = int(os.getenv("SUMMARY_BATCH_MAX_WAIT_MS", "250"))
+        self.SUMMARY_BATCH_MAX_CHARS = int(os.getenv("SUMMARY_BATCH_MAX_CHARS", "1500"))
+        
+        # Upper bound on Whisper calls in flight per worker (the transcription limiter's ceiling)
+        self.WHISPER_MAX_CONCURRENCY = int(os.getenv("WHISPER_MAX_CONCURRENCY", "16"))
+        # Longer audio is split at pauses into chunks of about this many seconds,
+        # transcribed in parallel; 0 sends each file as a single request
+        self.TRANSCRIPTION_CHUNK_SECONDS = float(os.getenv("TRANSCRIPTION_CHUNK_SECONDS", "60"))
+        
+        # Client-side OpenAI rate limiting: requests in flight grow while calls succeed
+        # within the target latency and halve on 429/5xx; RPM/TPM caps of 0 rely on
+        # the API's rate-limit headers alone
+        self.OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "32"))
+        self.OPENAI_INITIAL_CONCURRENCY = int(os.getenv("OPENAI_INITIAL_CONCURRENCY", "8"))
+        self.OPENAI_TARGET_LATENCY = float(os.getenv("OPENAI_TARGET_LATENCY", "30"))
+        self.OPENAI_CHAT_RPM = int(os.getenv("OPENAI_CHAT_RPM", "0"))
+        self.OPENAI_CHAT_TPM = int(os.getenv("OPENAI_CHAT_TPM", "0"))
+        self.OPENAI_TRANSCRIPTION_RPM = int(os.getenv("OPENAI_TRANSCRIPTION_RPM", "0"))
+        
+        # OpenAI Batch API (uploads submitted with priority=batch)
+        # Status checks start after BATCH_POLL_INTERVAL seconds and back off exponentially
+        self.BATCH_POLL_INTERVAL = float(os.getenv("BATCH_POLL_INTERVAL", "30"))
+        self.BATCH_POLL_MAX_INTERVAL = float(os.getenv("BATCH_POLL_MAX_INTERVAL", "600"))
+        # Batch job records, shared by the workers on a host through this directory;
+        # finished jobs (with their results) are kept BATCH_RESULT_TTL seconds
+        self.BATCH_JOBS_DIR = os.getenv("BATCH_JOBS_DIR", os.path.join(self.TEMP_DIR, "batch_jobs"))
+        self.BATCH_JOBS_MAX_MB = int(os.getenv("BATCH_JOBS_MAX_MB", "256"))
+        self.BATCH_RESULT_TTL = int(os.getenv("BATCH_RESULT_TTL", str(24 * 3600)))
+        
         # Logging
         self.LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
         self.LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        
+        self._api_keys_valid = None
+        
+        # Parsed once; the properties below are read on hot request paths
+        self._allowed_origins = tuple(origin.strip() for origin in self.ALLOWED_ORIGINS.split(","))
+        self._allowed_hosts = tuple(host.strip() for host in self.ALLOWED_HOSTS.split(",") if host.strip())
+        self._supported_formats = tuple(fmt.strip().lower() for fmt in self.SUPPORTED_FORMATS.split(","))
+        self._supported_formats_set = frozenset(self._supported_formats)
+    
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not set in __init__; the parsed value is
+        # stored on the instance so later reads skip this method
+        try:
+            env_var, parse, default = _LAZY_FIELDS[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}") from None
+        value = parse(os.getenv(env_var, default))
+        self.__dict__[name] = value
+        return value
+    
+    @property
+    def allowed_origins_list(self) -> Tuple[str, ...]:
+        return self._allowed_origins
+    
+    @property
+    def allowed_hosts_list(self) -> Tuple[str, ...]:
+        return self._allowed_hosts
     
     @property
-    def allowed_origins_list(self) -> List[str]:
-        return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
+    def supported_formats_list(self) -> Tuple[str, ...]:
+        return self._supported_formats
     
     @property
-    def supported_formats_list(self) -> List[str]:
-        return [fmt.strip().lower() for fmt in self.SUPPORTED_FORMATS.split(",")]
+    def supported_formats_set(self) -> FrozenSet[str]:
+        """Supported formats for O(1) membership checks."""
+        return self._supported_formats_set
     
     def validate_api_keys(self) -> bool:
-        if not self.OPENAI_API_KEY:
-            return False
-        if not self.OPENAI_API_KEY.startswith("sk-"):
-            return False
-        return True
+        # Keys are read once from the environment, so the result never changes
+        if self._api_keys_valid is None:
+            self._api_keys_valid = bool(self.OPENAI_API_KEY) and self.OPENAI_API_KEY.startswith("sk-")
+        return self._api_keys_valid
     
     def get_temp_dir(self) -> str:
         os.makedirs(self.TEMP_DIR, exist_ok=True)
@@ -58,28 +167,17 @@ class Settings:
         return not self.DEBUG
     
     def get_log_config(self) -> dict:
+        # Only the settings-dependent leaves are built per call
         return {
-            "version": 1,
-            "disable_existing_loggers": False,
-            "formatters": {
-                "default": {
-                    "format": self.LOG_FORMAT,
-                },
-            },
-            "handlers": {
-                "default": {
-                    "formatter": "default",
-                    "class": "logging.StreamHandler",
-                    "stream": "ext://sys.stdout",
-                },
-            },
-            "root": {
-                "level": self.LOG_LEVEL,
-                "handlers": ["default"],
-            },
+            **_LOG_CONFIG_TEMPLATE,
+            "formatters": {"default": {"format": self.LOG_FORMAT}},
+            "root": {"level": self.LOG_LEVEL, "handlers": ["default"]},
         }
 
 
-@lru_cache()
+# Built once at import; get_settings is called on every request via Depends
+_SETTINGS = Settings()
+
+
 def get_settings() -> Settings:
-    return Settings()
\ No newline at end of file
+    return _SETTINGS
\ No newline at end of file
@@ -3,17 +3,28 @@ Complete file handling utilities for audio/video processing.
 """
 
 import os
+import re
+import bisect
+import stat
+import time
 import shutil
+import logging
 import tempfile
 import mimetypes
-from typing import Optional, List
-from pathlib import Path
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from fastapi import UploadFile
 
+from app.utils.cache import TTLCache
+from app.utils.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
 
 # Supported audio/video formats
-SUPPORTED_AUDIO_TYPES = {
+SUPPORTED_AUDIO_TYPES = frozenset({
     "audio/mpeg",      # MP3
     "audio/wav",       # WAV  
     "audio/wave",      # WAV alternative
@@ -26,14 +37,66 @@ SUPPORTED_AUDIO_TYPES = {
     "audio/flac",      # FLAC
     "audio/webm",      # WebM audio
     "video/webm",      # WebM video
-}
+})
+_SUPPORTED_AUDIO_TYPES_SORTED = tuple(sorted(SUPPORTED_AUDIO_TYPES))
+
+# Extensions from the settings' pre-split format list, so the two can't drift
+SUPPORTED_EXTENSIONS = frozenset(f".{fmt}" for fmt in settings.supported_formats_list)
+_SUPPORTED_EXTENSIONS_SORTED = tuple(sorted(SUPPORTED_EXTENSIONS))
+
+# Any character outside the filename-safe set
+_UNSAFE_FILENAME_RE = re.compile(r"[^A-Za-z0-9._-]")
+
+# Maximum file size, shared with the API's upload limit
+MAX_FILE_SIZE = settings.MAX_FILE_SIZE
+
+# Copy buffer for saving uploads; shutil's default is 16KB (64KB on Linux)
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Temp directories this app creates, and how old they get before cleanup removes them
+TEMP_DIR_PREFIXES = ("meeting_analysis_", "session_", "audio_proc_")
+STALE_TEMP_DIR_AGE = 3600  # 1 hour
+
+# Processing time estimates: up to 1MB ~10s, 5MB ~30s, 15MB ~1min, larger ~2min
+_PROCESSING_SIZE_THRESHOLDS_MB = (1, 5, 15)
+_PROCESSING_TIMES = (10.0, 30.0, 60.0, 120.0)
+
+# Free bytes per directory; concurrent uploads reuse one disk_usage call
+DISK_USAGE_CACHE_TTL = 5
+_free_space_cache = TTLCache(maxsize=16, ttl=DISK_USAGE_CACHE_TTL)
+
+# Paths whose stat results are kept between validations; read once at import
+FILE_STAT_CACHE_SIZE = int(os.getenv("FILE_STAT_CACHE", "1024"))
+
+
+def _filename_extension(filename: str) -> str:
+    """Lowercase extension (with dot) of a bare filename, without building a Path."""
+    # A leading dot marks a hidden file, not an extension
+    dot = filename.rfind(".")
+    return filename[dot:].lower() if dot > 0 else ""
 
-SUPPORTED_EXTENSIONS = {
-    ".mp3", ".wav", ".m4a", ".mp4", ".ogg", ".flac", ".webm"
-}
 
-# Maximum file size (25MB)
-MAX_FILE_SIZE = 25 * 1024 * 1024
+@lru_cache(maxsize=FILE_STAT_CACHE_SIZE)
+def _cached_stat(file_path: str) -> os.stat_result:
+    """
+    Stat a file once and reuse the result for later lookups of the same path.
+    
+    Missing paths raise OSError and are not cached. cleanup_temp_files clears
+    the cache since it removes the files behind it.
+    
+    Args:
+        file_path: Path to stat
+        
+    Returns:
+        The path's stat result
+    """
+    return os.stat(file_path)
+
+
+@lru_cache(maxsize=256)
+def _guess_mime_type(extension: str) -> Optional[str]:
+    """MIME type for a lowercase file extension (with dot), looked up once per extension."""
+    return mimetypes.guess_type(f"file{extension}")[0]
 
 
 def validate_audio_file(file: UploadFile) -> bool:
@@ -50,7 +113,7 @@ def validate_audio_file(file: UploadFile) -> bool:
         return False
     
     # Check file extension
-    file_ext = Path(file.filename).suffix.lower()
+    file_ext = _filename_extension(file.filename)
     if file_ext not in SUPPORTED_EXTENSIONS:
         return False
     
@@ -80,15 +143,17 @@ def get_file_info(file_path: str) -> dict:
     Returns:
         Dictionary with file information
     """
-    if not os.path.exists(file_path):
+    try:
+        file_stat = _cached_stat(file_path)
+    except OSError:
         return {
             "exists": False,
             "error": "File not found"
         }
     
     try:
-        file_stat = os.stat(file_path)
-        mime_type, _ = mimetypes.guess_type(file_path)
+        file_ext = os.path.splitext(file_path)[1].lower()
+        mime_type = _guess_mime_type(file_ext)
         
         return {
             "exists": True,
@@ -96,10 +161,10 @@ def get_file_info(file_path: str) -> dict:
             "size": file_stat.st_size,
             "size_mb": round(file_stat.st_size / (1024 * 1024), 2),
             "mime_type": mime_type,
-            "extension": Path(file_path).suffix.lower(),
+            "extension": file_ext,
             "modified": file_stat.st_mtime,
             "is_valid_size": file_stat.st_size <= MAX_FILE_SIZE,
-            "is_supported_format": Path(file_path).suffix.lower() in SUPPORTED_EXTENSIONS
+            "is_supported_format": file_ext in SUPPORTED_EXTENSIONS
         }
     except Exception as e:
         return {
@@ -121,42 +186,78 @@ def create_temp_directory(prefix: str = "meeting_analysis_") -> str:
     return tempfile.mkdtemp(prefix=prefix)
 
 
+def _drop_page_cache(file_path: str) -> None:
+    """
+    Ask the kernel to evict a file's cached pages before it is deleted.
+    
+    Uploads and processed audio are read once, so their page cache only adds
+    memory pressure for concurrent requests. No-op where posix_fadvise is missing.
+    
+    Args:
+        file_path: Path to the file
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 def cleanup_temp_files(directory: Optional[str] = None) -> None:
     """
     Clean up temporary files and directories.
     
+    Blocking; call it from a background task or a worker thread.
+    
     Args:
         directory: Specific directory to clean up. If None, cleans all temp files.
     """
+    _cached_stat.cache_clear()
     try:
         if directory and os.path.exists(directory):
             if os.path.isfile(directory):
+                _drop_page_cache(directory)
                 os.remove(directory)
-                print(f"🗑️ Cleaned up temp file: {directory}")
+                logger.debug("Cleaned up temp file: %s", directory)
             elif os.path.isdir(directory):
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_file(follow_symlinks=False):
+                            _drop_page_cache(entry.path)
                 shutil.rmtree(directory)
-                print(f"🗑️ Cleaned up temp directory: {directory}")
+                logger.debug("Cleaned up temp directory: %s", directory)
         else:
             # Clean up old temp directories
             temp_base = tempfile.gettempdir()
+            # Compared with st_mtime, so wall-clock time
+            cutoff = time.time() - STALE_TEMP_DIR_AGE
             try:
-                for item in os.listdir(temp_base):
-                    if item.startswith("meeting_analysis_") or item.startswith("session_") or item.startswith("audio_proc_"):
-                        item_path = os.path.join(temp_base, item)
-                        if os.path.isdir(item_path):
-                            try:
-                                # Only remove if older than 1 hour
-                                if os.path.getmtime(item_path) < (time.time() - 3600):
-                                    shutil.rmtree(item_path)
-                                    print(f"🗑️ Cleaned up old temp directory: {item}")
-                            except Exception:
-                                pass  # Ignore cleanup errors for individual directories
+                # scandir entries carry the type, so only matching directories are stat'ed
+                with os.scandir(temp_base) as entries:
+                    for entry in entries:
+                        if entry.name.startswith(TEMP_DIR_PREFIXES):
+                            if entry.is_dir(follow_symlinks=False):
+                                try:
+                                    # Only remove if older than 1 hour
+                                    if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                                        shutil.rmtree(entry.path)
+                                        if logger.isEnabledFor(logging.DEBUG):
+                                            logger.debug("Cleaned up old temp directory: %s", entry.path)
+                                except Exception:
+                                    pass  # Ignore cleanup errors for individual directories
             except Exception:
                 pass  # Ignore if can't list temp directory
                 
-    except Exception as e:
-        print(f"⚠️ Cleanup warning: {e}")
+    except Exception:
         # Don't raise exceptions for cleanup failures
+        logger.warning("Cleanup failed", exc_info=True)
 
 
 def save_uploaded_file(file: UploadFile, directory: str, filename: Optional[str] = None) -> str:
@@ -183,13 +284,14 @@ def save_uploaded_file(file: UploadFile, directory: str, filename: Optional[str]
     # Create full file path
     file_path = os.path.join(directory, safe_filename)
     
-    # Save file
-    with open(file_path, "wb") as f:
-        shutil.copyfileobj(file.file, f)
+    # Save file; the copy buffer is large, so skip the file object's own buffer
+    with open(file_path, "wb", buffering=0) as f:
+        shutil.copyfileobj(file.file, f, COPY_BUFFER_SIZE)
     
     return file_path
 
 
+@lru_cache(maxsize=256)
 def get_safe_filename(filename: str) -> str:
     """
     Generate a safe filename by removing/replacing unsafe characters.
@@ -200,9 +302,8 @@ def get_safe_filename(filename: str) -> str:
     Returns:
         Safe filename
     """
-    # Keep only safe characters
-    safe_chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._-"
-    safe_filename = "".join(c if c in safe_chars else "_" for c in filename)
+    # Replace unsafe characters
+    safe_filename = _UNSAFE_FILENAME_RE.sub("_", filename)
     
     # Ensure filename starts with alphanumeric
     if safe_filename and not safe_filename[0].isalnum():
@@ -231,17 +332,10 @@ def estimate_processing_time(file_size: int) -> float:
     Returns:
         Estimated processing time in seconds
     """
-    # Rough estimate based on file size and API processing time
+    # Rough estimate based on file size and API processing time;
+    # bisect_left keeps each threshold inclusive (<= 1MB is ~10 seconds)
     mb_size = file_size / (1024 * 1024)
-    
-    if mb_size <= 1:
-        return 10.0  # Small files: ~10 seconds
-    elif mb_size <= 5:
-        return 30.0  # Medium files: ~30 seconds
-    elif mb_size <= 15:
-        return 60.0  # Large files: ~1 minute
-    else:
-        return 120.0  # Very large files: ~2 minutes
+    return _PROCESSING_TIMES[bisect.bisect_left(_PROCESSING_SIZE_THRESHOLDS_MB, mb_size)]
 
 
 def check_disk_space(required_space: int, path: str = None) -> bool:
@@ -259,8 +353,10 @@ def check_disk_space(required_space: int, path: str = None) -> bool:
         if path is None:
             path = tempfile.gettempdir()
             
-        stat = shutil.disk_usage(path)
-        available_space = stat.free
+        available_space = _free_space_cache.get(path)
+        if available_space is None:
+            available_space = shutil.disk_usage(path).free
+            _free_space_cache.set(path, available_space)
         
         # Require 2x the file size as buffer space
         return available_space > (required_space * 2)
@@ -270,24 +366,24 @@ def check_disk_space(required_space: int, path: str = None) -> bool:
         return True
 
 
-def get_supported_formats() -> List[str]:
+def get_supported_formats() -> Tuple[str, ...]:
     """
     Get list of supported file formats.
     
     Returns:
-        List of supported file extensions
+        Sorted supported file extensions
     """
-    return sorted(list(SUPPORTED_EXTENSIONS))
+    return _SUPPORTED_EXTENSIONS_SORTED
 
 
-def get_supported_mime_types() -> List[str]:
+def get_supported_mime_types() -> Tuple[str, ...]:
     """
     Get list of supported MIME types.
     
     Returns:
-        List of supported MIME types
+        Sorted supported MIME types
     """
-    return sorted(list(SUPPORTED_AUDIO_TYPES))
+    return _SUPPORTED_AUDIO_TYPES_SORTED
 
 
 def validate_file_path(file_path: str) -> bool:
@@ -301,29 +397,27 @@ def validate_file_path(file_path: str) -> bool:
         True if path is valid and safe
     """
     try:
-        # Check if file exists
-        if not os.path.exists(file_path):
+        # Check extension first; it needs no syscall
+        file_ext = os.path.splitext(file_path)[1].lower()
+        if file_ext not in SUPPORTED_EXTENSIONS:
             return False
         
-        # Check if it's actually a file
-        if not os.path.isfile(file_path):
+        # Check if file exists
+        try:
+            file_stat = _cached_stat(file_path)
+        except OSError:
             return False
         
-        # Check if file is readable
-        if not os.access(file_path, os.R_OK):
+        # Check if it's actually a file
+        if not stat.S_ISREG(file_stat.st_mode):
             return False
         
         # Check file size
-        file_size = os.path.getsize(file_path)
-        if file_size == 0 or file_size > MAX_FILE_SIZE:
-            return False
-        
-        # Check extension
-        file_ext = Path(file_path).suffix.lower()
-        if file_ext not in SUPPORTED_EXTENSIONS:
+        if not 0 < file_stat.st_size <= MAX_FILE_SIZE:
             return False
         
-        return True
+        # Check if file is readable
+        return os.access(file_path, os.R_OK)
         
     except Exception:
         return False
@@ -357,7 +451,7 @@ def get_file_extension(filename: str) -> str:
     Returns:
         File extension (lowercase, with dot)
     """
-    return Path(filename).suffix.lower()
+    return _filename_extension(filename)
 
 
 def is_audio_file(filename: str) -> bool:
@@ -370,7 +464,7 @@ def is_audio_file(filename: str) -> bool:
     Returns:
         True if filename has audio extension
     """
-    return get_file_extension(filename) in SUPPORTED_EXTENSIONS
+    return _filename_extension(filename) in SUPPORTED_EXTENSIONS
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -392,7 +486,3 @@ def format_file_size(size_bytes: int) -> str:
         size_bytes /= 1024.0
     
     return f"{size_bytes:.1f} TB"
-
-
-# Import time for cleanup function
-import time
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""
+Gunicorn configuration for Meeting Analysis API.
+
+Usage:
+    gunicorn -c gunicorn.conf.py app.main:app
+"""
+
+import os
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+timeout = int(os.getenv("WORKER_TIMEOUT", "300"))  # long uploads + OpenAI calls
+graceful_timeout = 30
+keepalive = 5
+accesslog = "-"
+errorlog = "-"
+loglevel = "info"
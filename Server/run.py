@@ -1,5 +1,6 @@
 import uvicorn
 from dotenv import load_dotenv
+import importlib.util
 import os
 
 # Load environment variables
@@ -19,5 +20,8 @@ if __name__ == "__main__":
         "app.main:app",
         host=host,
         port=port,
-        reload=reload
+        reload=reload,
+        # uvloop/httptools aren't available everywhere (e.g. Windows)
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "auto",
+        http="httptools" if importlib.util.find_spec("httptools") else "auto"
     )
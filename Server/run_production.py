@@ -1,9 +1,20 @@
 """
 Production server runner for Meeting Analysis API.
+
+Worker count comes from WEB_CONCURRENCY (or WORKERS), defaulting to
+(2 x CPU cores) + 1. Each worker is a separate process, so audio
+processing scales with the worker count. Equivalent command line:
+
+    uvicorn app.main:app --workers $((2 * $(nproc) + 1)) --loop uvloop --http httptools
+
+To run under gunicorn instead:
+
+    gunicorn -c gunicorn.conf.py app.main:app
 """
 
 import os
 import sys
+import importlib.util
 import uvicorn
 from pathlib import Path
 
@@ -19,7 +30,10 @@ if __name__ == "__main__":
     # Production configuration
     host = os.getenv("HOST", "127.0.0.1")
     port = int(os.getenv("PORT", 8000))
-    workers = int(os.getenv("WORKERS", 1))
+    default_workers = (os.cpu_count() or 1) * 2 + 1
+    workers = int(os.getenv("WEB_CONCURRENCY", os.getenv("WORKERS", default_workers)))
+    # One synchronous log line per request; turn off when a proxy already logs them
+    access_log = os.getenv("ACCESS_LOG", "true").lower() == "true"
     
     print(f"🚀 Starting Meeting Analysis API (Production)")
     print(f"🌐 Server: {host}:{port}")
@@ -33,6 +47,8 @@ if __name__ == "__main__":
         port=port,
         workers=workers,
         reload=False,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "auto",
+        http="httptools" if importlib.util.find_spec("httptools") else "auto",
         log_level="info",
-        access_log=True
+        access_log=access_log
     )
\ No newline at end of file